@@ -14,21 +14,176 @@ This module implements enhanced detection methods including:
 import numpy as np
 import pandas as pd
 import os
-import matplotlib.pyplot as plt
-import seaborn as sns
 from scipy import stats
 from collections import deque
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    import numba
+except ImportError:  # Numba is optional - fall back to the pure-Python kernels
+    numba = None
+
+# Canonical column layout for the combined violations frame; every detector
+# frame is reindexed to this schema so pd.concat skips column alignment
+_VIOLATION_COLUMNS = ['index', 'rule', 'severity', 'description', 'z_score',
+                      'action', 'method', 'type', 'value', 'modified_z_score',
+                      'slope', 'r_squared', 'change_in_sd']
+
+# Categorical dtypes for the label columns - coded storage instead of
+# per-row Python strings, and faster counting in the summary
+_SEVERITY_DTYPE = pd.CategoricalDtype(['CRITICAL', 'WARNING'], ordered=True)
+_METHOD_DTYPE = pd.CategoricalDtype(['Westgard', 'CUSUM', 'EWMA',
+                                     'Anomaly', 'Trend', 'Run'])
+
+
+def _cusum_kernel(values, mean, std, k, h):
+    """CUSUM recurrence: serial scan carried in scalar state
+
+    Returns the positive/negative CUSUM series plus the indices where each
+    side exceeds the decision interval h.
+    """
+    n = values.shape[0]
+    cusum_pos = np.empty(n)
+    cusum_neg = np.empty(n)
+    viol_pos = np.empty(n, dtype=np.int64)
+    viol_neg = np.empty(n, dtype=np.int64)
+    n_pos = 0
+    n_neg = 0
+    pp = 0.0
+    pn = 0.0
+    inv_std = 1.0 / std
+    for i in range(n):
+        deviation = (values[i] - mean) * inv_std
+        pp = max(0.0, pp + deviation - k)
+        pn = max(0.0, pn - deviation - k)
+        cusum_pos[i] = pp
+        cusum_neg[i] = pn
+        if pp > h:
+            viol_pos[n_pos] = i
+            n_pos += 1
+        if pn > h:
+            viol_neg[n_neg] = i
+            n_neg += 1
+    return cusum_pos, cusum_neg, viol_pos[:n_pos], viol_neg[:n_neg]
+
+
+if numba is not None:
+    _cusum_kernel = numba.njit(cache=True, fastmath=True)(_cusum_kernel)
+
+
+# Westgard rule metadata indexed by the scan kernel's rule codes
+_WESTGARD_RULE_NAMES = np.array(
+    ['1-3s', '2-2s', 'R-4s', '4-1s', '10-x', '7-T', '8-x', '6-x'], dtype=object)
+_WESTGARD_SEVERITIES = np.array(
+    ['CRITICAL', 'CRITICAL', 'CRITICAL', 'WARNING',
+     'CRITICAL', 'WARNING', 'WARNING', 'WARNING'], dtype=object)
+_WESTGARD_DESCRIPTIONS = np.array([
+    'Single value exceeds ±3σ',
+    'Two consecutive values exceed ±2σ (same side)',
+    'Range between consecutive values > 4σ',
+    'Four consecutive values exceed ±1σ (same side)',
+    '10 consecutive values on same side of mean',
+    'Seven consecutive trending values',
+    'Eight consecutive values avoid center (±1σ)',
+    'Six consecutive trending values'], dtype=object)
+_WESTGARD_ACTIONS = np.array([
+    'REJECT run - Random error',
+    'REJECT run - Systematic error',
+    'REJECT run - High random error',
+    'WARNING - Systematic shift trend',
+    'REJECT run - Systematic bias',
+    'WARNING - Systematic trend',
+    'WARNING - Increased variability',
+    'WARNING - Trend detected'], dtype=object)
+
+
+def _westgard_scan(values, mean, std):
+    """Fused single-pass Westgard scan with incremental run-length state
+
+    Evaluates all eight rules per element in one streaming sweep - no
+    per-rule window matrices - and returns parallel (index, rule_code)
+    arrays in chronological order.
+    """
+    n = values.shape[0]
+    idx_out = np.empty(8 * n, dtype=np.int64)
+    code_out = np.empty(8 * n, dtype=np.int64)
+    count = 0
+
+    inv_std = 1.0 / std
+    limit_4s = 4.0 * std
+    run_gt1 = 0      # consecutive z > 1
+    run_ltm1 = 0     # consecutive z < -1
+    run_abs1 = 0     # consecutive |z| > 1
+    run_above = 0    # consecutive values > mean
+    run_below = 0    # consecutive values < mean
+    run_up = 0       # consecutive rising diffs
+    run_down = 0     # consecutive falling diffs
+    prev_v = 0.0
+    prev_beyond2 = False
+    prev_above = False
+
+    for i in range(n):
+        v = values[i]
+        z = (v - mean) * inv_std
+        az = abs(z)
+        above = v > mean
+
+        run_gt1 = run_gt1 + 1 if z > 1 else 0
+        run_ltm1 = run_ltm1 + 1 if z < -1 else 0
+        run_abs1 = run_abs1 + 1 if az > 1 else 0
+        run_above = run_above + 1 if above else 0
+        run_below = run_below + 1 if v < mean else 0
+
+        d = 0.0
+        if i > 0:
+            d = v - prev_v
+            if d > 0:
+                run_up += 1
+                run_down = 0
+            elif d < 0:
+                run_down += 1
+                run_up = 0
+            else:
+                run_up = 0
+                run_down = 0
+
+        # Emit in the same rule order the scalar scan used
+        if az > 3:
+            idx_out[count] = i; code_out[count] = 0; count += 1
+        if i > 0 and az > 2 and prev_beyond2 and above == prev_above:
+            idx_out[count] = i; code_out[count] = 1; count += 1
+        if i > 0 and abs(d) > limit_4s:
+            idx_out[count] = i; code_out[count] = 2; count += 1
+        if run_gt1 >= 4 or run_ltm1 >= 4:
+            idx_out[count] = i; code_out[count] = 3; count += 1
+        if run_above >= 10 or run_below >= 10:
+            idx_out[count] = i; code_out[count] = 4; count += 1
+        if run_up >= 6 or run_down >= 6:
+            idx_out[count] = i; code_out[count] = 5; count += 1
+        if run_abs1 >= 8:
+            idx_out[count] = i; code_out[count] = 6; count += 1
+        if run_up >= 5 or run_down >= 5:
+            idx_out[count] = i; code_out[count] = 7; count += 1
+
+        prev_v = v
+        prev_beyond2 = az > 2
+        prev_above = above
+
+    return idx_out[:count], code_out[:count]
+
+
+if numba is not None:
+    _westgard_scan = numba.njit(cache=True, boundscheck=False)(_westgard_scan)
+
 
 class AdvancedFaultDetector:
     """Advanced fault detection for laboratory QC"""
     
-    def __init__(self, mean, std, sensitivity='medium'):
+    def __init__(self, mean, std, sensitivity='medium', dtype=np.float64):
         """
         Initialize detector
-        
+
         Parameters:
         -----------
         mean : float
@@ -37,10 +192,16 @@ class AdvancedFaultDetector:
             Target standard deviation
         sensitivity : str
             'high', 'medium', 'low' - affects alert thresholds
+        dtype : numpy dtype
+            Working precision for the detector arrays. np.float32 halves
+            memory traffic on long series; QC readings rarely carry more
+            than 3-4 significant figures, so the default float64 is only
+            needed when feeding the results into further computation.
         """
         self.mean = mean
         self.std = std
         self.sensitivity = sensitivity
+        self.dtype = np.dtype(dtype)
         
         # Sensitivity settings
         self.thresholds = {
@@ -48,7 +209,17 @@ class AdvancedFaultDetector:
             'medium': {'warning': 2.0, 'alert': 2.5, 'critical': 3.0},
             'low': {'warning': 2.5, 'alert': 3.0, 'critical': 3.5}
         }
-        
+
+        # Hot-path scalars hoisted out of the detectors: the selected
+        # sensitivity band as plain floats, and the reciprocal std so
+        # z-scores use a multiply instead of a divide
+        band = self.thresholds[sensitivity]
+        self.thr_warning = band['warning']
+        self.thr_alert = band['alert']
+        self.thr_critical = band['critical']
+        self._inv_std = 1.0 / std
+
+
         # CUSUM parameters
         self.cusum_k = 0.5  # Reference value (usually 0.5*sigma)
         self.cusum_h = 4.0  # Decision interval (usually 4-5*sigma)
@@ -57,169 +228,182 @@ class AdvancedFaultDetector:
         self.ewma_lambda = 0.2  # Weighting factor (0.2-0.3 typical)
         self.ewma_L = 2.7  # Control limit multiplier
         
-    def extended_westgard_rules(self, values):
+    def _prepare(self, values):
+        """Precompute the arrays every rule is derived from
+
+        Returns (values, z, abs_z, above, diffs) so z-scores and per-step
+        differences are computed exactly once per series. `above` is a
+        boolean side-of-mean mask - cheaper than float np.sign comparisons
+        for the same-side rules.
+        """
+        values = np.asarray(values, dtype=self.dtype)
+        z = (values - self.mean) * self._inv_std
+        return values, z, np.abs(z), values > self.mean, np.diff(values)
+
+    def extended_westgard_rules(self, values, precomputed=None):
         """
         Apply all 12 Westgard rules (expanded set)
-        
+
         Returns violations with severity levels
         """
-        violations = []
+        values, z, abs_z, above, diffs = precomputed or self._prepare(values)
         n = len(values)
-        
-        for i in range(n):
-            z_score = (values[i] - self.mean) / self.std
-            
-            # Rule 1-3s: One observation > 3 SD
-            if abs(z_score) > 3:
-                violations.append({
-                    'index': i,
-                    'rule': '1-3s',
-                    'severity': 'CRITICAL',
-                    'description': 'Single value exceeds ±3σ',
-                    'z_score': z_score,
-                    'action': 'REJECT run - Random error'
-                })
-            
-            # Rule 2-2s: Two consecutive > 2 SD (same side)
-            if i > 0:
-                z_prev = (values[i-1] - self.mean) / self.std
-                if abs(z_score) > 2 and abs(z_prev) > 2 and np.sign(z_score) == np.sign(z_prev):
-                    violations.append({
-                        'index': i,
-                        'rule': '2-2s',
-                        'severity': 'CRITICAL',
-                        'description': 'Two consecutive values exceed ±2σ (same side)',
-                        'z_score': z_score,
-                        'action': 'REJECT run - Systematic error'
-                    })
-            
-            # Rule R-4s: Range of consecutive values > 4 SD
-            if i > 0:
-                range_val = abs(values[i] - values[i-1])
-                if range_val > 4 * self.std:
-                    violations.append({
-                        'index': i,
-                        'rule': 'R-4s',
-                        'severity': 'CRITICAL',
-                        'description': 'Range between consecutive values > 4σ',
-                        'z_score': z_score,
-                        'action': 'REJECT run - High random error'
-                    })
-            
-            # Rule 4-1s: Four consecutive > 1 SD (same side)
-            if i >= 3:
-                last_4_z = [(values[j] - self.mean) / self.std for j in range(i-3, i+1)]
-                if all(z > 1 for z in last_4_z) or all(z < -1 for z in last_4_z):
-                    violations.append({
-                        'index': i,
-                        'rule': '4-1s',
-                        'severity': 'WARNING',
-                        'description': 'Four consecutive values exceed ±1σ (same side)',
-                        'z_score': z_score,
-                        'action': 'WARNING - Systematic shift trend'
-                    })
-            
-            # Rule 10-x: 10 consecutive on same side of mean
-            if i >= 9:
-                last_10 = values[i-9:i+1]
-                if all(val > self.mean for val in last_10) or all(val < self.mean for val in last_10):
-                    violations.append({
-                        'index': i,
-                        'rule': '10-x',
-                        'severity': 'CRITICAL',
-                        'description': '10 consecutive values on same side of mean',
-                        'z_score': z_score,
-                        'action': 'REJECT run - Systematic bias'
-                    })
-            
-            # Rule 7-T: Seven consecutive increasing or decreasing
-            if i >= 6:
-                last_7 = values[i-6:i+1]
-                diffs = np.diff(last_7)
-                if all(d > 0 for d in diffs) or all(d < 0 for d in diffs):
-                    violations.append({
-                        'index': i,
-                        'rule': '7-T',
-                        'severity': 'WARNING',
-                        'description': 'Seven consecutive trending values',
-                        'z_score': z_score,
-                        'action': 'WARNING - Systematic trend'
-                    })
-            
-            # Rule 8-x: Eight consecutive on both sides but none in middle third
-            if i >= 7:
-                last_8_z = [(values[j] - self.mean) / self.std for j in range(i-7, i+1)]
-                if all(abs(z) > 1 for z in last_8_z):
-                    violations.append({
-                        'index': i,
-                        'rule': '8-x',
-                        'severity': 'WARNING',
-                        'description': 'Eight consecutive values avoid center (±1σ)',
-                        'z_score': z_score,
-                        'action': 'WARNING - Increased variability'
-                    })
-            
-            # Rule 6-x: Six consecutive all increasing or decreasing
-            if i >= 5:
-                last_6 = values[i-5:i+1]
-                diffs = np.diff(last_6)
-                if all(d > 0 for d in diffs) or all(d < 0 for d in diffs):
-                    violations.append({
-                        'index': i,
-                        'rule': '6-x',
-                        'severity': 'WARNING',
-                        'description': 'Six consecutive trending values',
-                        'z_score': z_score,
-                        'action': 'WARNING - Trend detected'
-                    })
-        
-        return pd.DataFrame(violations)
+        if n == 0:
+            return pd.DataFrame()
+
+        if numba is not None:
+            # Fused single-pass kernel; codes map straight into the
+            # metadata arrays, and emission order is already chronological
+            idx, codes = _westgard_scan(
+                np.ascontiguousarray(values, dtype=np.float64),
+                self.mean, self.std)
+            if len(idx) == 0:
+                return pd.DataFrame()
+            return pd.DataFrame({
+                'index': idx,
+                'rule': _WESTGARD_RULE_NAMES[codes],
+                'severity': _WESTGARD_SEVERITIES[codes],
+                'description': _WESTGARD_DESCRIPTIONS[codes],
+                'z_score': z[idx],
+                'action': _WESTGARD_ACTIONS[codes]
+            })
+
+        sliding = np.lib.stride_tricks.sliding_window_view
+
+        # All diff-based rules (R-4s, 7-T, 6-x) share these masks - one
+        # comparison pass over diffs instead of one per rule
+        rising = diffs > 0
+        falling = diffs < 0
+
+        def trending(window):
+            """Ending indices of strictly monotonic runs of `window` values"""
+            if n < window:
+                return np.array([], dtype=np.intp)
+            hits = (sliding(rising, window - 1).all(axis=1) |
+                    sliding(falling, window - 1).all(axis=1))
+            return np.where(hits)[0] + window - 1
+
+        def same_side(mask, window):
+            """Ending indices where `mask` holds for `window` consecutive values"""
+            if n < window:
+                return np.array([], dtype=np.intp)
+            w = sliding(mask, window)
+            hits = w.all(axis=1)
+            return np.where(hits)[0] + window - 1
+
+        # Rule 1-3s: One observation > 3 SD
+        idx_13s = np.where(abs_z > 3)[0]
+
+        # Rule 2-2s: Two consecutive > 2 SD (same side); with |z| > 2 on
+        # both points, boolean side flags decide "same side" exactly
+        beyond_2s = abs_z > 2
+        idx_22s = np.where(beyond_2s[1:] & beyond_2s[:-1] &
+                           (above[1:] == above[:-1]))[0] + 1
+
+        # Rule R-4s: Range of consecutive values > 4 SD
+        idx_r4s = np.where(np.abs(diffs) > 4 * self.std)[0] + 1
+
+        # Rule 4-1s: Four consecutive > 1 SD (same side)
+        idx_41s = np.union1d(same_side(z > 1, 4), same_side(z < -1, 4))
+
+        # Rule 10-x: 10 consecutive on same side of mean
+        idx_10x = np.union1d(same_side(above, 10),
+                             same_side(values < self.mean, 10))
+
+        # Rule 7-T: Seven consecutive increasing or decreasing
+        idx_7t = trending(7)
+
+        # Rule 8-x: Eight consecutive on both sides but none in middle third
+        idx_8x = same_side(abs_z > 1, 8)
+
+        # Rule 6-x: Six consecutive all increasing or decreasing
+        idx_6x = trending(6)
+
+        # Assemble one frame per rule, then concatenate; the stable sort on
+        # index reproduces the chronological order of the scalar scan
+        rule_frames = []
+        for idx, rule, severity, description, action in [
+            (idx_13s, '1-3s', 'CRITICAL', 'Single value exceeds ±3σ',
+             'REJECT run - Random error'),
+            (idx_22s, '2-2s', 'CRITICAL', 'Two consecutive values exceed ±2σ (same side)',
+             'REJECT run - Systematic error'),
+            (idx_r4s, 'R-4s', 'CRITICAL', 'Range between consecutive values > 4σ',
+             'REJECT run - High random error'),
+            (idx_41s, '4-1s', 'WARNING', 'Four consecutive values exceed ±1σ (same side)',
+             'WARNING - Systematic shift trend'),
+            (idx_10x, '10-x', 'CRITICAL', '10 consecutive values on same side of mean',
+             'REJECT run - Systematic bias'),
+            (idx_7t, '7-T', 'WARNING', 'Seven consecutive trending values',
+             'WARNING - Systematic trend'),
+            (idx_8x, '8-x', 'WARNING', 'Eight consecutive values avoid center (±1σ)',
+             'WARNING - Increased variability'),
+            (idx_6x, '6-x', 'WARNING', 'Six consecutive trending values',
+             'WARNING - Trend detected'),
+        ]:
+            if len(idx) == 0:
+                continue
+            rule_frames.append(pd.DataFrame({
+                'index': idx,
+                'rule': rule,
+                'severity': severity,
+                'description': description,
+                'z_score': z[idx],
+                'action': action
+            }))
+
+        if not rule_frames:
+            return pd.DataFrame()
+
+        violations = pd.concat(rule_frames, ignore_index=True)
+        return violations.sort_values('index', kind='mergesort',
+                                      ignore_index=True)
     
     def cusum_detection(self, values):
         """
         CUSUM (Cumulative Sum) control chart
         Highly sensitive to small sustained shifts
         """
-        n = len(values)
-        cusum_pos = np.zeros(n)
-        cusum_neg = np.zeros(n)
-        
-        violations = []
-        
-        for i in range(n):
-            deviation = (values[i] - self.mean) / self.std
-            
-            # Positive CUSUM
-            if i == 0:
-                cusum_pos[i] = max(0, deviation - self.cusum_k)
-                cusum_neg[i] = max(0, -deviation - self.cusum_k)
-            else:
-                cusum_pos[i] = max(0, cusum_pos[i-1] + deviation - self.cusum_k)
-                cusum_neg[i] = max(0, cusum_neg[i-1] - deviation - self.cusum_k)
-            
-            # Check for violations
-            if cusum_pos[i] > self.cusum_h:
-                violations.append({
-                    'index': i,
-                    'type': 'CUSUM_HIGH',
-                    'severity': 'CRITICAL',
-                    'description': f'Upward shift detected (CUSUM+ = {cusum_pos[i]:.2f})',
-                    'value': cusum_pos[i],
-                    'action': 'REJECT - Sustained upward shift'
-                })
-            
-            if cusum_neg[i] > self.cusum_h:
-                violations.append({
-                    'index': i,
-                    'type': 'CUSUM_LOW',
-                    'severity': 'CRITICAL',
-                    'description': f'Downward shift detected (CUSUM- = {cusum_neg[i]:.2f})',
-                    'value': cusum_neg[i],
-                    'action': 'REJECT - Sustained downward shift'
-                })
-        
+        values = np.ascontiguousarray(values, dtype=self.dtype)
+        if len(values) == 0:
+            return {
+                'violations': pd.DataFrame(),
+                'cusum_pos': np.zeros(0),
+                'cusum_neg': np.zeros(0)
+            }
+        cusum_pos, cusum_neg, idx_pos, idx_neg = _cusum_kernel(
+            values, self.mean, self.std, self.cusum_k, self.cusum_h)
+
+        frames = []
+        if len(idx_pos) > 0:
+            frames.append(pd.DataFrame({
+                'index': idx_pos,
+                'type': 'CUSUM_HIGH',
+                'severity': 'CRITICAL',
+                'description': [f'Upward shift detected (CUSUM+ = {v:.2f})'
+                                for v in cusum_pos[idx_pos]],
+                'value': cusum_pos[idx_pos],
+                'action': 'REJECT - Sustained upward shift'
+            }))
+        if len(idx_neg) > 0:
+            frames.append(pd.DataFrame({
+                'index': idx_neg,
+                'type': 'CUSUM_LOW',
+                'severity': 'CRITICAL',
+                'description': [f'Downward shift detected (CUSUM- = {v:.2f})'
+                                for v in cusum_neg[idx_neg]],
+                'value': cusum_neg[idx_neg],
+                'action': 'REJECT - Sustained downward shift'
+            }))
+
+        if frames:
+            violations = pd.concat(frames, ignore_index=True)
+            violations = violations.sort_values('index', kind='mergesort',
+                                                ignore_index=True)
+        else:
+            violations = pd.DataFrame()
+
         return {
-            'violations': pd.DataFrame(violations),
+            'violations': violations,
             'cusum_pos': cusum_pos,
             'cusum_neg': cusum_neg
         }
@@ -229,42 +413,63 @@ class AdvancedFaultDetector:
         EWMA (Exponentially Weighted Moving Average)
         Good for detecting small shifts
         """
+        values = np.asarray(values, dtype=self.dtype)
         n = len(values)
-        ewma = np.zeros(n)
-        ewma[0] = values[0]
-        
+        if n == 0:
+            return {
+                'violations': pd.DataFrame(),
+                'ewma': np.zeros(0),
+                'ucl': self.mean,
+                'lcl': self.mean
+            }
+
         # Calculate control limits
         sigma_ewma = self.std * np.sqrt(self.ewma_lambda / (2 - self.ewma_lambda))
         ucl = self.mean + self.ewma_L * sigma_ewma
         lcl = self.mean - self.ewma_L * sigma_ewma
-        
-        violations = []
-        
-        for i in range(1, n):
-            ewma[i] = self.ewma_lambda * values[i] + (1 - self.ewma_lambda) * ewma[i-1]
-            
-            if ewma[i] > ucl:
-                violations.append({
-                    'index': i,
-                    'type': 'EWMA_HIGH',
-                    'severity': 'WARNING',
-                    'description': f'EWMA exceeds upper limit ({ewma[i]:.4f} > {ucl:.4f})',
-                    'value': ewma[i],
-                    'action': 'WARNING - Upward trend detected'
-                })
-            
-            if ewma[i] < lcl:
-                violations.append({
-                    'index': i,
-                    'type': 'EWMA_LOW',
-                    'severity': 'WARNING',
-                    'description': f'EWMA below lower limit ({ewma[i]:.4f} < {lcl:.4f})',
-                    'value': ewma[i],
-                    'action': 'WARNING - Downward trend detected'
-                })
-        
+
+        # pandas runs the EWMA recurrence in Cython with Kahan-compensated
+        # summation; adjust=False is the exact recursion used here, with
+        # ewma[0] = values[0] as the seed
+        ewma = (pd.Series(values)
+                .ewm(alpha=self.ewma_lambda, adjust=False)
+                .mean().to_numpy())
+
+        # Index 0 is the seed point and is never flagged
+        high_idx = np.where(ewma[1:] > ucl)[0] + 1
+        low_idx = np.where(ewma[1:] < lcl)[0] + 1
+
+        frames = []
+        if len(high_idx) > 0:
+            frames.append(pd.DataFrame({
+                'index': high_idx,
+                'type': 'EWMA_HIGH',
+                'severity': 'WARNING',
+                'description': [f'EWMA exceeds upper limit ({v:.4f} > {ucl:.4f})'
+                                for v in ewma[high_idx]],
+                'value': ewma[high_idx],
+                'action': 'WARNING - Upward trend detected'
+            }))
+        if len(low_idx) > 0:
+            frames.append(pd.DataFrame({
+                'index': low_idx,
+                'type': 'EWMA_LOW',
+                'severity': 'WARNING',
+                'description': [f'EWMA below lower limit ({v:.4f} < {lcl:.4f})'
+                                for v in ewma[low_idx]],
+                'value': ewma[low_idx],
+                'action': 'WARNING - Downward trend detected'
+            }))
+
+        if frames:
+            violations = pd.concat(frames, ignore_index=True)
+            violations = violations.sort_values('index', kind='mergesort',
+                                                ignore_index=True)
+        else:
+            violations = pd.DataFrame()
+
         return {
-            'violations': pd.DataFrame(violations),
+            'violations': violations,
             'ewma': ewma,
             'ucl': ucl,
             'lcl': lcl
@@ -275,106 +480,139 @@ class AdvancedFaultDetector:
         Statistical anomaly detection using modified Z-score
         Uses median absolute deviation (MAD) for robustness
         """
-        median = np.median(values)
-        mad = np.median(np.abs(values - median))
-        
-        # Modified Z-score
-        modified_z_scores = 0.6745 * (values - median) / mad if mad > 0 else np.zeros_len(values)
-        
-        anomalies = []
-        for i, z_score in enumerate(modified_z_scores):
-            if abs(z_score) > threshold:
-                severity = 'CRITICAL' if abs(z_score) > 4.5 else 'WARNING'
-                anomalies.append({
-                    'index': i,
-                    'type': 'STATISTICAL_ANOMALY',
-                    'severity': severity,
-                    'description': f'Statistical outlier (modified Z = {z_score:.2f})',
-                    'modified_z_score': z_score,
-                    'action': f'{severity} - Outlier detected'
-                })
-        
-        return pd.DataFrame(anomalies)
+        values = np.asarray(values, dtype=self.dtype)
+        median = np.median(values) if len(values) else 0.0
+        mad = np.median(np.abs(values - median)) if len(values) else 0.0
+
+        # Modified Z-score (all zeros when MAD degenerates to 0)
+        if mad > 0:
+            modified_z_scores = 0.6745 * (values - median) / mad
+        else:
+            modified_z_scores = np.zeros_like(values)
+
+        abs_mz = np.abs(modified_z_scores)
+        idx = np.where(abs_mz > threshold)[0]
+        if len(idx) == 0:
+            return pd.DataFrame()
+
+        mz = modified_z_scores[idx]
+        severity = np.where(abs_mz[idx] > 4.5, 'CRITICAL', 'WARNING')
+
+        return pd.DataFrame({
+            'index': idx,
+            'type': 'STATISTICAL_ANOMALY',
+            'severity': severity,
+            'description': [f'Statistical outlier (modified Z = {z:.2f})'
+                            for z in mz],
+            'modified_z_score': mz,
+            'action': [f'{s} - Outlier detected' for s in severity]
+        })
     
     def trend_detection(self, values, window=10):
         """
         Detect trends using linear regression on moving windows
         """
+        values = np.asarray(values, dtype=self.dtype)
         n = len(values)
-        trends = []
-        
-        for i in range(window, n):
-            window_data = values[i-window:i]
-            x = np.arange(window)
-            
-            # Linear regression
-            slope, intercept, r_value, p_value, std_err = stats.linregress(x, window_data)
-            
-            # Determine if trend is significant
-            if p_value < 0.05:  # Significant trend
-                trend_direction = 'UPWARD' if slope > 0 else 'DOWNWARD'
-                
-                # Calculate change over window
-                change = slope * window / self.std  # Normalize by SD
-                
-                if abs(change) > 1.5:  # Significant change
-                    severity = 'WARNING' if abs(change) < 2.5 else 'CRITICAL'
-                    trends.append({
-                        'index': i,
-                        'type': f'TREND_{trend_direction}',
-                        'severity': severity,
-                        'description': f'{trend_direction.capitalize()} trend (slope={slope:.4f}, R²={r_value**2:.3f})',
-                        'slope': slope,
-                        'r_squared': r_value**2,
-                        'change_in_sd': change,
-                        'action': f'{severity} - Systematic {trend_direction.lower()} drift'
-                    })
-        
-        return pd.DataFrame(trends)
+        if n <= window:
+            return pd.DataFrame()
+
+        # The regressor x = arange(window) is identical for every window, so
+        # the OLS slope/r^2/p-value follow in closed form from rolling sums
+        # of y, y^2 and x*y - no per-window linregress call needed
+        x = np.arange(window, dtype=np.float64)
+        w = float(window)
+        Sx = x.sum()
+        Sxx_c = (x * x).sum() - Sx * Sx / w
+
+        ones = np.ones(window)
+        Sy = np.convolve(values, ones, 'valid')[:n - window]
+        Syy = np.convolve(values * values, ones, 'valid')[:n - window]
+        Sxy = np.convolve(values, x[::-1], 'valid')[:n - window]
+
+        Sxy_c = Sxy - Sx * Sy / w
+        Syy_c = Syy - Sy * Sy / w
+        slope = Sxy_c / Sxx_c
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r_squared = np.where(Syy_c > 0, Sxy_c * Sxy_c / (Sxx_c * Syy_c), 0.0)
+            # Two-sided t-test on the slope, df = window - 2
+            t_stat = np.sqrt(r_squared * (w - 2) / np.maximum(1.0 - r_squared, 1e-300))
+        p_value = 2 * stats.t.sf(t_stat, window - 2)
+
+        # Significant trend with a meaningful change over the window
+        change = slope * window / self.std  # Normalize by SD
+        mask = (p_value < 0.05) & (np.abs(change) > 1.5)
+        hit = np.where(mask)[0]
+        if len(hit) == 0:
+            return pd.DataFrame()
+
+        slope_h = slope[hit]
+        r2_h = r_squared[hit]
+        change_h = change[hit]
+        direction = np.where(slope_h > 0, 'UPWARD', 'DOWNWARD')
+        severity = np.where(np.abs(change_h) < 2.5, 'WARNING', 'CRITICAL')
+
+        return pd.DataFrame({
+            'index': hit + window,
+            'type': ['TREND_' + d for d in direction],
+            'severity': severity,
+            'description': [f'{d.capitalize()} trend (slope={s:.4f}, R²={r2:.3f})'
+                            for d, s, r2 in zip(direction, slope_h, r2_h)],
+            'slope': slope_h,
+            'r_squared': r2_h,
+            'change_in_sd': change_h,
+            'action': [f'{sev} - Systematic {d.lower()} drift'
+                       for sev, d in zip(severity, direction)]
+        })
     
-    def run_analysis(self, values):
+    def run_analysis(self, values, precomputed=None):
         """
         Run rules analysis - detect unusual patterns
         """
-        violations = []
+        values, _, _, above, diffs = precomputed or self._prepare(values)
         n = len(values)
-        
-        for i in range(7, n):  # Need at least 7 points
-            last_9 = values[i-8:i+1]
-            
-            # Run above/below mean
-            above = sum(1 for v in last_9 if v > self.mean)
-            below = sum(1 for v in last_9 if v < self.mean)
-            
-            # 6 out of 7 on same side
-            if i >= 6:
-                last_7 = values[i-6:i+1]
-                above_7 = sum(1 for v in last_7 if v > self.mean)
-                if above_7 >= 6 or above_7 <= 1:
-                    violations.append({
-                        'index': i,
-                        'type': 'RUN_RULE_6/7',
-                        'severity': 'WARNING',
-                        'description': '6 out of 7 points on same side of mean',
-                        'action': 'WARNING - Potential bias'
-                    })
-            
-            # Alternating pattern (zigzag)
-            if i >= 7:
-                last_8 = values[i-7:i+1]
-                diffs = np.diff(last_8)
-                sign_changes = sum(1 for j in range(len(diffs)-1) 
-                                 if np.sign(diffs[j]) != np.sign(diffs[j+1]))
-                if sign_changes >= 6:  # Many sign changes
-                    violations.append({
-                        'index': i,
-                        'type': 'ZIGZAG_PATTERN',
-                        'severity': 'WARNING',
-                        'description': 'Excessive alternating pattern detected',
-                        'action': 'WARNING - Check for systematic variation'
-                    })
-        
-        return pd.DataFrame(violations)
+        if n < 8:  # Need at least 8 points (ending index >= 7)
+            return pd.DataFrame()
+
+        # 6 out of 7 on same side: prefix sums turn each window count
+        # into one subtraction instead of a 7-wide reduction
+        above_cum = np.concatenate(([0], np.cumsum(above)))
+        above_7 = above_cum[7:] - above_cum[:-7]
+        hits = (above_7 >= 6) | (above_7 <= 1)
+        run_idx = np.where(hits)[0] + 6
+        run_idx = run_idx[run_idx >= 7]
+
+        # Alternating pattern (zigzag): direction flips are XORs of
+        # consecutive boolean up-flags - no float sign math needed
+        up = (diffs > 0).view(np.uint8)
+        sign_changes = up[1:] ^ up[:-1]
+        sc_cum = np.concatenate(([0], np.cumsum(sign_changes)))
+        zigzag_idx = np.where(sc_cum[6:] - sc_cum[:-6] >= 6)[0] + 7
+
+        # Build one frame per pattern type; stable sort restores run order
+        frames = []
+        if len(run_idx) > 0:
+            frames.append(pd.DataFrame({
+                'index': run_idx,
+                'type': 'RUN_RULE_6/7',
+                'severity': 'WARNING',
+                'description': '6 out of 7 points on same side of mean',
+                'action': 'WARNING - Potential bias'
+            }))
+        if len(zigzag_idx) > 0:
+            frames.append(pd.DataFrame({
+                'index': zigzag_idx,
+                'type': 'ZIGZAG_PATTERN',
+                'severity': 'WARNING',
+                'description': 'Excessive alternating pattern detected',
+                'action': 'WARNING - Check for systematic variation'
+            }))
+
+        if not frames:
+            return pd.DataFrame()
+        violations = pd.concat(frames, ignore_index=True)
+        return violations.sort_values('index', kind='mergesort',
+                                      ignore_index=True)
     
     def comprehensive_analysis(self, values, save_dir=None):
         """
@@ -382,9 +620,12 @@ class AdvancedFaultDetector:
         """
         print("Running comprehensive fault detection...")
         print("="*80)
-        
+
+        # Shared precomputation (z-scores, diffs) reused by the detectors
+        precomputed = self._prepare(values)
+
         # 1. Extended Westgard Rules
-        westgard = self.extended_westgard_rules(values)
+        westgard = self.extended_westgard_rules(values, precomputed=precomputed)
         print(f"✓ Westgard Rules: {len(westgard)} violations")
         
         # 2. CUSUM
@@ -404,69 +645,72 @@ class AdvancedFaultDetector:
         print(f"✓ Trend Detection: {len(trends)} trends")
         
         # 6. Run Analysis
-        runs = self.run_analysis(values)
+        runs = self.run_analysis(values, precomputed=precomputed)
         print(f"✓ Run Analysis: {len(runs)} patterns")
         
         print("="*80)
         
-        # Combine all results
-        all_violations = pd.concat([
-            westgard.assign(method='Westgard'),
-            cusum_result['violations'].assign(method='CUSUM'),
-            ewma_result['violations'].assign(method='EWMA'),
-            anomalies.assign(method='Anomaly'),
-            trends.assign(method='Trend'),
-            runs.assign(method='Run')
-        ], ignore_index=True)
-        
-        # Sort by index (chronological order)
-        if len(all_violations) > 0:
-            all_violations = all_violations.sort_values('index').reset_index(drop=True)
+        # Combine all results on a shared schema so concat is a plain copy
+        frames = [
+            frame.assign(method=method).reindex(columns=_VIOLATION_COLUMNS)
+            for frame, method in [
+                (westgard, 'Westgard'),
+                (cusum_result['violations'], 'CUSUM'),
+                (ewma_result['violations'], 'EWMA'),
+                (anomalies, 'Anomaly'),
+                (trends, 'Trend'),
+                (runs, 'Run')
+            ] if len(frame) > 0
+        ]
+
+        # Sort by index (chronological order); mergesort keeps method order
+        # stable for ties
+        if frames:
+            all_violations = pd.concat(frames, ignore_index=True)
+            all_violations = all_violations.sort_values('index', kind='mergesort',
+                                                        ignore_index=True)
+        else:
+            all_violations = pd.DataFrame(columns=_VIOLATION_COLUMNS)
+
+        all_violations['severity'] = all_violations['severity'].astype(_SEVERITY_DTYPE)
+        all_violations['method'] = all_violations['method'].astype(_METHOD_DTYPE)
         # Optionally save CUSUM/EWMA analyses to CSV
         if save_dir:
-            try:
-                os.makedirs(save_dir, exist_ok=True)
-            except Exception:
-                pass
-
-            # CUSUM summary (pos/neg series)
-            cusum = cusum_result
+            os.makedirs(save_dir, exist_ok=True)
             n = len(values)
-            try:
-                cusum_df = pd.DataFrame({
-                    'run': np.arange(n) + 1,
-                    'cusum_pos': cusum['cusum_pos'],
-                    'cusum_neg': cusum['cusum_neg']
-                })
-                cusum_df.to_csv(os.path.join(save_dir, 'cusum_analysis.csv'), index=False)
-            except Exception:
-                # Don't fail the analysis if saving fails
-                pass
+            runs_col = np.arange(n) + 1
 
-            # EWMA series with control limits
-            ewma = ewma_result
+            # Pure-numeric series go straight through np.savetxt - no
+            # intermediate DataFrame, compact %.6g formatting
             try:
-                ewma_df = pd.DataFrame({
-                    'run': np.arange(n) + 1,
-                    'ewma': ewma['ewma']
-                })
-                ewma_df['ucl'] = ewma.get('ucl', np.nan)
-                ewma_df['lcl'] = ewma.get('lcl', np.nan)
-                ewma_df.to_csv(os.path.join(save_dir, 'ewma_analysis.csv'), index=False)
-            except Exception:
-                pass
+                np.savetxt(os.path.join(save_dir, 'cusum_analysis.csv'),
+                           np.column_stack([runs_col,
+                                            cusum_result['cusum_pos'],
+                                            cusum_result['cusum_neg']]),
+                           delimiter=',', comments='',
+                           header='run,cusum_pos,cusum_neg',
+                           fmt=['%d', '%.6g', '%.6g'])
 
-            # Also save any CUSUM/EWMA violations if present
-            try:
-                if isinstance(cusum.get('violations'), pd.DataFrame) and len(cusum['violations']) > 0:
-                    cusum['violations'].to_csv(os.path.join(save_dir, 'cusum_violations.csv'), index=False)
-            except Exception:
-                pass
+                np.savetxt(os.path.join(save_dir, 'ewma_analysis.csv'),
+                           np.column_stack([runs_col,
+                                            ewma_result['ewma'],
+                                            np.full(n, ewma_result['ucl']),
+                                            np.full(n, ewma_result['lcl'])]),
+                           delimiter=',', comments='',
+                           header='run,ewma,ucl,lcl',
+                           fmt=['%d', '%.6g', '%.6g', '%.6g'])
 
-            try:
-                if isinstance(ewma.get('violations'), pd.DataFrame) and len(ewma['violations']) > 0:
-                    ewma['violations'].to_csv(os.path.join(save_dir, 'ewma_violations.csv'), index=False)
-            except Exception:
+                # Also save any CUSUM/EWMA violations if present
+                if len(cusum_result['violations']) > 0:
+                    cusum_result['violations'].to_csv(
+                        os.path.join(save_dir, 'cusum_violations.csv'),
+                        index=False, float_format='%.6g', lineterminator='\n')
+                if len(ewma_result['violations']) > 0:
+                    ewma_result['violations'].to_csv(
+                        os.path.join(save_dir, 'ewma_violations.csv'),
+                        index=False, float_format='%.6g', lineterminator='\n')
+            except OSError:
+                # Don't fail the analysis if saving fails
                 pass
 
         return {
@@ -491,12 +735,18 @@ class AdvancedFaultDetector:
                 'message': '✅ No violations detected - QC is in control'
             }
         
+        # value_counts on the categorical codes beats boolean masks and
+        # groupby().size(); drop zero-count categories to keep the dicts
+        # identical to the old groupby output
+        severity_counts = violations['severity'].value_counts()
+        method_counts = violations['method'].value_counts()
+
         summary = {
             'total_violations': len(violations),
-            'critical': len(violations[violations['severity'] == 'CRITICAL']),
-            'warning': len(violations[violations['severity'] == 'WARNING']),
-            'methods': violations.groupby('method').size().to_dict(),
-            'by_severity': violations.groupby('severity').size().to_dict()
+            'critical': int(severity_counts.get('CRITICAL', 0)),
+            'warning': int(severity_counts.get('WARNING', 0)),
+            'methods': {k: int(v) for k, v in method_counts.items() if v > 0},
+            'by_severity': {k: int(v) for k, v in severity_counts.items() if v > 0}
         }
         
         if summary['critical'] > 0:
@@ -512,6 +762,10 @@ class AdvancedFaultDetector:
         """
         Create comprehensive visualization of all detection methods
         """
+        # Imported here so analysis-only callers never pay the matplotlib
+        # import cost (font cache, backend init, ~50 MB RSS)
+        import matplotlib.pyplot as plt
+
         fig = plt.figure(figsize=(18, 12))
         gs = fig.add_gridspec(3, 2, hspace=0.3, wspace=0.3)
         
@@ -528,11 +782,12 @@ class AdvancedFaultDetector:
         ax1.axhline(self.mean + 3*self.std, color='red', linestyle='-', alpha=0.7, label='±3σ')
         ax1.axhline(self.mean - 3*self.std, color='red', linestyle='-', alpha=0.7)
         
-        # Mark violations
+        # Mark violations (single draw call for all markers)
         westgard = results['westgard']
         if len(westgard) > 0:
-            for _, v in westgard.iterrows():
-                ax1.plot(v['index'], values[v['index']], 'rx', markersize=12, markeredgewidth=3)
+            idx = westgard['index'].to_numpy()
+            ax1.plot(idx, np.asarray(values)[idx], 'rx', linestyle='none',
+                     markersize=12, markeredgewidth=3)
         
         ax1.set_title(f'{analyte_name} - Levey-Jennings Chart with Westgard Rules', fontweight='bold', fontsize=14)
         ax1.set_xlabel('Run Number')
@@ -576,18 +831,21 @@ class AdvancedFaultDetector:
             methods = all_viol['method'].unique()
             colors = plt.cm.tab10(np.linspace(0, 1, len(methods)))
             method_colors = dict(zip(methods, colors))
-            
-            for method in methods:
-                method_viol = all_viol[all_viol['method'] == method]
-                y_val = list(methods).index(method)
-                
-                for _, v in method_viol.iterrows():
-                    marker = 'X' if v['severity'] == 'CRITICAL' else 'o'
-                    size = 200 if v['severity'] == 'CRITICAL' else 100
-                    ax4.scatter(v['index'], y_val, marker=marker, s=size, 
-                              color=method_colors[method], edgecolor='black', linewidth=1.5,
-                              label=method if _ == method_viol.index[0] else '')
-            
+            method_y = {m: y for y, m in enumerate(methods)}
+
+            # One scatter per (method, severity) group instead of per row
+            labeled = set()
+            for (method, severity), group in all_viol.groupby(['method', 'severity'],
+                                                              observed=True, sort=False):
+                idx = group['index'].to_numpy()
+                ax4.scatter(idx, np.full(len(idx), method_y[method]),
+                            marker='X' if severity == 'CRITICAL' else 'o',
+                            s=200 if severity == 'CRITICAL' else 100,
+                            color=method_colors[method], edgecolor='black',
+                            linewidth=1.5,
+                            label=method if method not in labeled else '')
+                labeled.add(method)
+
             ax4.set_yticks(range(len(methods)))
             ax4.set_yticklabels(methods)
             ax4.set_xlabel('Run Number')
@@ -608,6 +866,8 @@ class AdvancedFaultDetector:
 
 def demo_advanced_detection():
     """Demonstration of advanced fault detection"""
+    import matplotlib.pyplot as plt
+
     print("\n" + "="*80)
     print("ADVANCED FAULT DETECTION DEMONSTRATION")
     print("="*80)
@@ -0,0 +1,173 @@
+// Clientside callbacks for the QC dashboard. One qc-tick store carries
+// the whole per-tick snapshot — newest chart point, alert/stats state
+// and any violations-log refresh — and every live element renders from
+// it in the browser, so the server serializes one small JSON object
+// per tick instead of figures and HTML trees.
+
+(function () {
+    // Dash renders plain {namespace, type, props} objects as components
+    function el(type, props) {
+        return {namespace: 'dash_html_components', type: type, props: props};
+    }
+
+    // Sigma quality tiers, mirroring the server-side ladder
+    var SIGMA_TIERS = [
+        [6, '#2ecc71', 'World Class'],
+        [5, '#27ae60', 'Excellent'],
+        [4, '#f39c12', 'Good'],
+        [3, '#e67e22', 'Marginal']
+    ];
+
+    function sigmaTier(sigma) {
+        for (var i = 0; i < SIGMA_TIERS.length; i++) {
+            if (sigma >= SIGMA_TIERS[i][0]) {
+                return SIGMA_TIERS[i];
+            }
+        }
+        return [0, '#e74c3c', 'Poor'];
+    }
+
+    var BANNER_STYLE = {
+        color: 'white',
+        padding: '15px',
+        borderRadius: '5px',
+        textAlign: 'center',
+        fontWeight: 'bold'
+    };
+
+    function extendPoint(tick, key) {
+        if (!tick || !tick.point) {
+            return window.dash_clientside.no_update;
+        }
+        var p = tick.point;
+        return [{x: [[p.t]], y: [[p[key]]]}, [0], p.max];
+    }
+
+    function renderAlert(tick, analyte, label) {
+        if (!tick || !tick.state) {
+            return window.dash_clientside.no_update;
+        }
+        var a = tick.state[analyte];
+        if (a.alert === 'ALERT') {
+            var style = Object.assign({backgroundColor: '#e74c3c'}, BANNER_STYLE);
+            return el('Div', {children: [
+                el('H4', {children: '🚨 ' + label + ' ALERT',
+                          style: {margin: '0 0 10px 0'}}),
+                el('P', {children: a.message, style: {margin: 0}}),
+                el('P', {children: 'Total Violations: ' + a.count,
+                         style: {margin: '10px 0 0 0', fontSize: '14px'}})
+            ], style: style});
+        }
+        return el('Div', {children: [
+            el('H4', {children: '✅ ' + label + ' OK',
+                      style: {margin: '0 0 10px 0'}}),
+            el('P', {children: 'All controls within limits', style: {margin: 0}})
+        ], style: Object.assign({backgroundColor: '#2ecc71'}, BANNER_STYLE)});
+    }
+
+    function statsRow(label, value, valueStyle) {
+        return el('Tr', {children: [
+            el('Td', {children: label, style: {fontWeight: 'bold'}}),
+            el('Td', {children: value, style: valueStyle})
+        ]});
+    }
+
+    function renderStats(tick, analyte, label, accent) {
+        if (!tick || !tick.state) {
+            return window.dash_clientside.no_update;
+        }
+        var a = tick.state[analyte];
+        var s = a.stats;
+        var tier = sigmaTier(s.sigma || 0);
+        var sigmaStyle = {color: tier[1], fontWeight: 'bold'};
+        return el('Div', {children: [
+            el('H4', {children: label + ' Statistics',
+                      style: {color: '#2c3e50',
+                              borderBottom: '2px solid ' + accent,
+                              paddingBottom: '10px'}}),
+            el('Table', {children: [
+                statsRow('Target Mean:', a.target.toFixed(4) + ' ' + a.unit),
+                statsRow('Current Mean:', (s.mean || 0).toFixed(4) + ' ' + a.unit),
+                statsRow('SD:', (s.sd || 0).toFixed(4)),
+                statsRow('CV:', (s.cv || 0).toFixed(2) + '%'),
+                statsRow('Bias:', (s.bias || 0).toFixed(2) + '%'),
+                statsRow('Sigma:', (s.sigma || 0).toFixed(2), sigmaStyle),
+                statsRow('Quality:', tier[2], sigmaStyle),
+                statsRow('N:', String(s.n || 0))
+            ], style: {width: '100%', fontSize: '14px'}})
+        ], style: {backgroundColor: 'white', padding: '15px',
+                   borderRadius: '5px'}});
+    }
+
+    function violationItem(v) {
+        var severityColor = v.severity === 'CRITICAL' ? '#e74c3c' : '#f39c12';
+        return el('Div', {children: [
+            el('Div', {children: [
+                el('Span', {children: v.analyte.toUpperCase(),
+                            style: {fontWeight: 'bold', marginRight: '10px'}}),
+                el('Span', {children: v.rule,
+                            style: {backgroundColor: severityColor,
+                                    color: 'white', padding: '2px 8px',
+                                    borderRadius: '3px', fontSize: '12px',
+                                    marginRight: '10px'}}),
+                el('Span', {children: v.time,
+                            style: {color: '#7f8c8d', fontSize: '12px'}})
+            ]}),
+            el('Div', {children: v.message,
+                       style: {marginTop: '5px', fontSize: '14px'}}),
+            el('Div', {children: 'Value: ' + v.value.toFixed(4),
+                       style: {marginTop: '5px', fontSize: '12px',
+                               color: '#7f8c8d'}})
+        ], style: {backgroundColor: 'white', padding: '15px',
+                   borderRadius: '5px', marginBottom: '10px',
+                   borderLeft: '4px solid ' + severityColor}});
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        qc: {
+            extendCreatinine: function (tick) {
+                return extendPoint(tick, 'c');
+            },
+
+            extendUrea: function (tick) {
+                return extendPoint(tick, 'u');
+            },
+
+            renderTime: function (tick) {
+                if (!tick || !tick.state) {
+                    return window.dash_clientside.no_update;
+                }
+                return 'Last Update: ' + tick.state.ts;
+            },
+
+            renderCreatinineAlert: function (tick) {
+                return renderAlert(tick, 'creatinine', 'CREATININE');
+            },
+
+            renderUreaAlert: function (tick) {
+                return renderAlert(tick, 'urea', 'UREA');
+            },
+
+            renderCreatinineStats: function (tick) {
+                return renderStats(tick, 'creatinine', 'Creatinine', '#3498db');
+            },
+
+            renderUreaStats: function (tick) {
+                return renderStats(tick, 'urea', 'Urea', '#9b59b6');
+            },
+
+            renderViolations: function (tick) {
+                if (!tick || tick.viol === null || tick.viol === undefined) {
+                    return window.dash_clientside.no_update;
+                }
+                if (tick.viol.length === 0) {
+                    return el('Div', {children: 'No violations detected',
+                                      style: {textAlign: 'center',
+                                              color: '#7f8c8d',
+                                              padding: '20px'}});
+                }
+                return el('Div', {children: tick.viol.map(violationItem)});
+            }
+        }
+    });
+})();
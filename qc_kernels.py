@@ -0,0 +1,142 @@
+"""Scalar hot-path kernels for the real-time QC monitors
+
+The per-frame Westgard check and Welford accumulation are pure scalar
+arithmetic with branches — exactly what Numba compiles well. Numba is
+optional: when it is not installed the plain-Python versions run
+unchanged.
+"""
+
+import numpy as np
+
+try:
+    import numba
+    prange = numba.prange
+except ImportError:
+    numba = None
+    prange = range
+
+# Rule codes returned by westgard_and_update; the Python layer maps
+# them back to names and messages only when a violation is displayed
+RULE_NAMES = ('1-3s', '2-2s', 'R-4s')
+RULE_MESSAGES = ('Control exceeds ±3 SD',
+                 '2 consecutive exceed ±2 SD',
+                 'Range exceeds 4 SD')
+
+
+def westgard_and_update(x, prev, have_prev, mean, inv_std, std,
+                        mean_acc, M2, count):
+    """Fused Welford accumulation and Westgard check for one point
+
+    ``count`` is the window size including ``x``. Returns
+    ``(rule, mean_acc, M2)`` where ``rule`` indexes RULE_NAMES, or -1
+    when no rule fires.
+    """
+    # Welford accumulation for the appended point
+    delta = x - mean_acc
+    mean_acc += delta / count
+    M2 += delta * (x - mean_acc)
+
+    rule = -1
+    if have_prev:
+        z = (x - mean) * inv_std
+        if abs(z) > 3.0:
+            rule = 0  # 1-3s
+        else:
+            z_prev = (prev - mean) * inv_std
+            if abs(z) > 2.0 and abs(z_prev) > 2.0 and (z > 0.0) == (z_prev > 0.0):
+                rule = 1  # 2-2s
+            elif abs(x - prev) > 4.0 * std:
+                rule = 2  # R-4s
+
+    return rule, mean_acc, M2
+
+
+def westgard_full(x, values, z, mean, std):
+    """Five-rule Westgard check over the dashboard's ordered window
+
+    ``x`` is the new measurement; ``values``/``z`` are the window views
+    it was just appended to, so the "previous" slot the 2-2s and R-4s
+    rules read is the last stored element — the same layout the Python
+    rule ladder always saw. Returns 0 when no rule fires, else 1=1-3s,
+    2=2-2s, 3=R-4s, 4=4-1s, 5=10-x; the caller maps codes to
+    names/severities only on violation.
+    """
+    n = values.shape[0]
+    if n < 2:
+        return 0
+
+    z_new = z[n - 1]
+    az = abs(z_new)
+
+    # ~70% of points land inside ±1 SD, where only 10-x can fire
+    if az >= 1.0:
+        if az > 3.0:
+            return 1
+        z_prev = z[n - 1]
+        if az > 2.0 and abs(z_prev) > 2.0 and (z_new > 0.0) == (z_prev > 0.0):
+            return 2
+        if abs(x - values[n - 1]) > 4.0 * std:
+            return 3
+        if n >= 3:
+            if z_new > 1.0:
+                run = True
+                for i in range(n - 3, n):
+                    if z[i] <= 1.0:
+                        run = False
+                        break
+                if run:
+                    return 4
+            elif z_new < -1.0:
+                run = True
+                for i in range(n - 3, n):
+                    if z[i] >= -1.0:
+                        run = False
+                        break
+                if run:
+                    return 4
+
+    if n >= 9:
+        if x > mean:
+            run = True
+            for i in range(n - 9, n):
+                if values[i] <= mean:
+                    run = False
+                    break
+            if run:
+                return 5
+        elif x < mean:
+            run = True
+            for i in range(n - 9, n):
+                if values[i] >= mean:
+                    run = False
+                    break
+            if run:
+                return 5
+
+    return 0
+
+
+def replay_rules(values, mean, inv_std, std, have_first):
+    """Westgard rule codes for a whole batch of measurements
+
+    The live path checks each point against the sample just appended —
+    the point itself — so the per-point checks carry no loop-borne
+    state and prange can split (and auto-vectorize) them freely.
+    ``have_first`` says whether the window already held a point before
+    the batch, i.e. whether index 0 gets checked at all.
+    """
+    n = values.shape[0]
+    rules = np.empty(n, np.int64)
+    for i in prange(n):
+        rule, _, _ = westgard_and_update(
+            values[i], values[i], have_first or i > 0,
+            mean, inv_std, std, 0.0, 0.0, 1)
+        rules[i] = rule
+    return rules
+
+
+if numba is not None:
+    westgard_and_update = numba.njit(cache=True, fastmath=True)(
+        westgard_and_update)
+    westgard_full = numba.njit(cache=True, fastmath=True)(westgard_full)
+    replay_rules = numba.njit(parallel=True, cache=True)(replay_rules)
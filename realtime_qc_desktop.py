@@ -7,9 +7,88 @@ import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 from matplotlib.patches import Rectangle
 import numpy as np
-from datetime import datetime, timedelta
-from collections import deque
+import time
+from bisect import bisect_right
+from array import array
+from collections import deque, namedtuple
 from lab_qc_analysis import LabQCAnalysis
+from qc_kernels import (RULE_MESSAGES, RULE_NAMES, replay_rules,
+                        westgard_and_update)
+
+# Sigma quality tiers: one bisect into these tuples replaces the
+# five-branch if/elif ladder used on every frame
+_SIGMA_BINS = (3, 4, 5, 6)
+_SIGMA_COLORS = ('red', 'orange', 'yellow', 'lightgreen', 'green')
+_SIGMA_LABELS = ('Poor', 'Marginal', 'Good', 'Excellent', 'World Class')
+
+# Per-analyte constants resolved once at init; mirrors AnalyteParams in
+# lab_qc_analysis but adds the precomputed reciprocal and TEa%
+AnalyteCache = namedtuple('AnalyteCache',
+                          ('mean', 'std', 'inv_std', 'tea_pct', 'unit'))
+
+# Violation history cap: old entries beyond this are dropped so memory
+# stays bounded on long monitoring sessions
+_MAX_VIOLATIONS = 100
+
+
+class _RandomPool:
+    """Batched scalar draws from a PCG64 Generator
+
+    A single-scalar np.random call costs a Python-to-C dispatch every
+    frame; drawing 4096 values at a time amortizes that overhead to
+    one call per few thousand frames.
+    """
+
+    def __init__(self, size=4096):
+        self._rng = np.random.default_rng()
+        self._size = size
+        self._norm = self._rng.standard_normal(size)
+        self._unif = self._rng.random(size)
+        self._sign = 1.0 - 2.0 * self._rng.integers(0, 2, size)
+        self._npos = self._upos = self._spos = 0
+
+    def normal(self):
+        if self._npos == self._size:
+            self._norm = self._rng.standard_normal(self._size)
+            self._npos = 0
+        v = self._norm[self._npos]
+        self._npos += 1
+        return v
+
+    def uniform(self):
+        if self._upos == self._size:
+            self._unif = self._rng.random(self._size)
+            self._upos = 0
+        v = self._unif[self._upos]
+        self._upos += 1
+        return v
+
+    def sign(self):
+        if self._spos == self._size:
+            self._sign = 1.0 - 2.0 * self._rng.integers(0, 2, self._size)
+            self._spos = 0
+        v = self._sign[self._spos]
+        self._spos += 1
+        return v
+
+
+def _watch_visibility(monitor, fig):
+    """Track window visibility so animate can skip rendering while hidden
+
+    The timer keeps firing when the window is iconified; buffers stay
+    current but the draw work is skipped. Map/unmap hooks exist only on
+    Tk backends, so they are attached opportunistically.
+    """
+    monitor._visible = True
+    fig.canvas.mpl_connect('close_event',
+                           lambda event: setattr(monitor, '_visible', False))
+    try:
+        widget = fig.canvas.get_tk_widget()
+    except AttributeError:
+        return
+    widget.bind('<Unmap>', lambda event: setattr(monitor, '_visible', False))
+    widget.bind('<Map>', lambda event: setattr(monitor, '_visible', True))
+
 
 class RealtimeQCMonitor:
     def __init__(self, analyte='creatinine', max_points=50):
@@ -17,82 +96,300 @@ class RealtimeQCMonitor:
         self.analyte = analyte
         self.params = self.qc.parameters[analyte]
         self.max_points = max_points
-        
-        # Data storage
-        self.times = deque(maxlen=max_points)
-        self.values = deque(maxlen=max_points)
-        self.violations = []
-        
+
+        # Hoist the per-analyte constants out of the params dict: the
+        # hot paths read them every frame, and attribute access plus a
+        # precomputed 1/std is cheaper than repeated dict lookups and
+        # divisions
+        self._mean = self.params['mean']
+        self._std = self.params['std']
+        self._inv_std = 1.0 / self.params['std']
+        self._tea_pct = self.params['tea'] * 100
+        self._unit = self.params['unit']
+        
+        # Data storage: preallocated sliding windows instead of deques,
+        # so statistics and set_data get zero-copy array views rather
+        # than a list()+np.array() rebuild every frame. When full, the
+        # window shifts left in place (a 50-double memmove), which keeps
+        # the views contiguous and in plot order.
+        self._times_buf = np.empty(max_points, dtype=np.int64)
+        self._values_buf = np.empty(max_points)
+        self._n = 0
+
+        # Violation history as parallel typed arrays + int rule codes:
+        # no dict per violation, bounded to the last _MAX_VIOLATIONS
+        self._viol_run_hist = array('l')
+        self._viol_code_hist = array('b')
+        self._viol_value_hist = array('d')
+
+        # Violation marker coordinates, stored at detection time so the
+        # scatter update never has to search the window; entries are
+        # dropped from the left once they scroll out of it
+        self._viol_xs = deque(maxlen=max_points)
+        self._viol_ys = deque(maxlen=max_points)
+
+        # Rolling pre-formatted alert text, rebuilt only when a new
+        # violation arrives; steady-state frames just set_text it
+        self._viol_display = deque(maxlen=5)
+        self._viol_text = ('Recent Westgard Violations:\n'
+                           '  ✓ No violations detected')
+
+        # Welford accumulators: mean and M2 are maintained incrementally
+        # as points enter and leave the window, so update_statistics is
+        # O(1) instead of re-reducing the whole window every frame
+        self._mean_acc = 0.0
+        self._M2 = 0.0
+
+        self._pool = _RandomPool()
+
         # Statistics
         self.current_stats = {'mean': 0, 'sd': 0, 'cv': 0, 'bias': 0, 'sigma': 0}
         
         # Initialize plot
         self.fig, (self.ax1, self.ax2) = plt.subplots(2, 1, figsize=(14, 10))
-        self.fig.suptitle(f'Real-Time QC Monitor - {analyte.capitalize()}', 
+        self.fig.suptitle(f'Real-Time QC Monitor - {analyte.capitalize()}',
                          fontsize=16, fontweight='bold')
-        
+
         # Add run number counter
         self.run_number = 0
-        
+
+        # Persistent artists: animate() mutates these in place instead of
+        # clearing both axes and rebuilding every line, limit and label,
+        # so each frame only pushes the changed artists through the
+        # renderer (blit-friendly)
+        mean = self._mean
+        std = self._std
+
+        # The path and its markers are separate artists: most points
+        # keep a small cheap marker and only the latest point gets the
+        # large one, instead of rasterizing 50 size-8 markers per frame
+        self.trend_line, = self.ax1.plot([], [], '-', color='steelblue',
+                                         linewidth=2, label='Measurements')
+        self.markers, = self.ax1.plot([], [], 'o', color='steelblue',
+                                      markersize=6)
+        self.current_marker, = self.ax1.plot([], [], 'o', color='steelblue',
+                                             markersize=10)
+
+        # Control limits are constant per analyte; draw them once
+        self.ax1.axhline(y=mean, color='green', linestyle='-', linewidth=2, label='Mean')
+        self.ax1.axhline(y=mean + std, color='yellow', linestyle='--', linewidth=1.5, label='±1 SD')
+        self.ax1.axhline(y=mean - std, color='yellow', linestyle='--', linewidth=1.5)
+        self.ax1.axhline(y=mean + 2*std, color='orange', linestyle='--', linewidth=1.5, label='±2 SD')
+        self.ax1.axhline(y=mean - 2*std, color='orange', linestyle='--', linewidth=1.5)
+        self.ax1.axhline(y=mean + 3*std, color='red', linestyle='-', linewidth=2, label='±3 SD')
+        self.ax1.axhline(y=mean - 3*std, color='red', linestyle='-', linewidth=2)
+
+        self.violation_scatter = self.ax1.scatter([], [], marker='x',
+                                                  color='red', s=225,
+                                                  linewidths=3, zorder=3)
+
+        self.ax1.set_xlabel('Run Number', fontsize=12, fontweight='bold')
+        self.ax1.set_ylabel(f'{analyte.capitalize()} ({self.params["unit"]})',
+                            fontsize=12, fontweight='bold')
+        self.ax1.set_title('Levey-Jennings Chart', fontsize=14, fontweight='bold')
+        self.ax1.legend(loc='upper right', fontsize=10)
+        self.ax1.grid(True, alpha=0.3)
+
+        # Statistics dashboard: fixed title plus two mutable text artists
+        self.ax2.axis('off')
+        self.ax2.text(0.5, 0.95, 'Real-Time Statistics & Alerts',
+                      ha='center', va='top', fontsize=14, fontweight='bold',
+                      transform=self.ax2.transAxes)
+        self.stats_text = self.ax2.text(0.05, 0.85, '', ha='left', va='top',
+                                        fontsize=11, family='monospace',
+                                        transform=self.ax2.transAxes)
+        self.sigma_label_text = self.ax2.text(0.75, 0.775, '', ha='center',
+                                              va='center', fontsize=12,
+                                              fontweight='bold',
+                                              transform=self.ax2.transAxes)
+        self.violations_text_artist = self.ax2.text(0.5, 0.35, '',
+                                                    ha='center', va='top',
+                                                    fontsize=10,
+                                                    family='monospace',
+                                                    transform=self.ax2.transAxes)
+
+        # Indicator boxes: fixed geometry, only the facecolor changes,
+        # so allocate the patches once and recolor them per frame
+        self.sigma_rect = Rectangle((0.55, 0.70), 0.4, 0.15,
+                                    facecolor='lightgray', alpha=0.3,
+                                    transform=self.ax2.transAxes)
+        self.ax2.add_patch(self.sigma_rect)
+        self.alert_rect = Rectangle((0.05, 0.05), 0.9, 0.35,
+                                    facecolor='lightgreen', alpha=0.3,
+                                    transform=self.ax2.transAxes)
+        self.ax2.add_patch(self.alert_rect)
+
+        # Prebuilt stats template: the target block is constant, so it
+        # is baked in once and only the current values are formatted per
+        # frame; the key of rounded displayed values lets animate skip
+        # set_text entirely when nothing visible changed
+        self._stats_tmpl = (
+            "\nRun Number: {run}\n"
+            "Last Update: {time}\n\n"
+            "Current Statistics:\n"
+            "  Mean:  {mean:.4f} " + self._unit + "\n"
+            "  SD:    {sd:.4f}\n"
+            "  CV:    {cv:.2f}%\n"
+            "  Bias:  {bias:.2f}%\n"
+            "  Sigma: {sigma:.2f}\n\n"
+            "Target Values:\n"
+            f"  Mean:  {self._mean:.4f} {self._unit}\n"
+            f"  SD:    {self._std:.4f}\n"
+            f"  TEa:   {self._tea_pct:.1f}%\n"
+        ).format
+        self._last_stats_key = None
+
+        # Clock display has seconds granularity; re-render the string
+        # only when the second changes instead of allocating a datetime
+        # per frame
+        self._last_sec = -1
+        self._time_str = ''
+
+        _watch_visibility(self, self.fig)
+
+        self.fig.tight_layout()
+
+        # Manual blitting: only these artists move, so full draws skip
+        # them (animated=True), capture the static background, and each
+        # frame restores that background and re-draws just this list,
+        # bypassing the full-figure compositing pass
+        self._animated_chart = (self.trend_line, self.markers,
+                                self.current_marker, self.violation_scatter)
+        self._animated_panel = (self.stats_text, self.sigma_label_text,
+                                self.violations_text_artist,
+                                self.sigma_rect, self.alert_rect)
+        for artist in self._animated_chart + self._animated_panel:
+            artist.set_animated(True)
+        self._chart_bg = None
+        self._panel_bg = None
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
+
+    def _on_draw(self, event):
+        """Recapture backgrounds after every full draw"""
+        canvas = self.fig.canvas
+        self._chart_bg = canvas.copy_from_bbox(self.ax1.bbox)
+        self._panel_bg = canvas.copy_from_bbox(self.ax2.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._animated_chart:
+            self.ax1.draw_artist(artist)
+        for artist in self._animated_panel:
+            self.ax2.draw_artist(artist)
+
+    def _append(self, run, value):
+        """Push a measurement into the sliding window, evicting the oldest"""
+        if self._n == self.max_points:
+            # West's deletion update removes the evicted point's
+            # contribution from the accumulators in O(1)
+            old = self._values_buf[0]
+            delta = old - self._mean_acc
+            self._mean_acc -= delta / (self._n - 1)
+            self._M2 -= delta * (old - self._mean_acc)
+            if self._M2 < 0.0:  # guard against round-off drift
+                self._M2 = 0.0
+            self._n -= 1
+            self._times_buf[:-1] = self._times_buf[1:]
+            self._values_buf[:-1] = self._values_buf[1:]
+
+        self._times_buf[self._n] = run
+        self._values_buf[self._n] = value
+        self._n += 1
+
+    def window(self):
+        """Current (times, values) window as zero-copy views"""
+        return self._times_buf[:self._n], self._values_buf[:self._n]
+
     def generate_measurement(self):
         """Generate a new measurement with occasional anomalies"""
         # 70% normal, 15% shift, 15% outlier
-        rand = np.random.random()
-        
+        rand = self._pool.uniform()
+
         if rand < 0.70:  # Normal
-            value = np.random.normal(self.params['mean'], self.params['std'])
+            value = self._mean + self._pool.normal() * self._std
         elif rand < 0.85:  # Systematic shift
-            value = np.random.normal(self.params['mean'] + 1.5 * self.params['std'], 
-                                    self.params['std'])
+            value = self._mean + 1.5 * self._std + self._pool.normal() * self._std
         else:  # Outlier
-            value = np.random.normal(self.params['mean'], self.params['std'])
-            value += np.random.choice([-1, 1]) * 3.5 * self.params['std']
-        
+            value = self._mean + self._pool.normal() * self._std
+            value += self._pool.sign() * 3.5 * self._std
+
         return value
-    
-    def check_westgard(self, new_value):
-        """Quick Westgard rule check"""
-        if len(self.values) < 2:
-            return None
-        
-        mean = self.params['mean']
-        std = self.params['std']
-        z_score = (new_value - mean) / std
-        
-        # Rule 1-3s
-        if abs(z_score) > 3:
-            return {'rule': '1-3s', 'severity': 'CRITICAL', 
-                   'message': 'Control exceeds ±3 SD'}
-        
-        # Rule 2-2s
-        if len(self.values) >= 1:
-            z_prev = (self.values[-1] - mean) / std
-            if abs(z_score) > 2 and abs(z_prev) > 2:
-                if np.sign(z_score) == np.sign(z_prev):
-                    return {'rule': '2-2s', 'severity': 'CRITICAL',
-                           'message': '2 consecutive exceed ±2 SD'}
-        
-        # Rule R-4s
-        if len(self.values) >= 1:
-            if abs(new_value - self.values[-1]) > 4 * std:
-                return {'rule': 'R-4s', 'severity': 'CRITICAL',
-                       'message': 'Range exceeds 4 SD'}
-        
-        return None
-    
+
+    def replay(self, n_frames):
+        """Backfill n_frames of measurements without rendering anything
+
+        Draws the whole batch from the same anomaly mix as
+        generate_measurement in a few vectorized calls, runs every
+        Westgard check in one kernel pass, and leaves the window,
+        accumulators and violation history as if animate had run that
+        many times with the window hidden. Useful for benchmarking and
+        for warm-starting a monitor with history.
+        """
+        rng = self._pool._rng
+        values = self._mean + rng.standard_normal(n_frames) * self._std
+        rand = rng.random(n_frames)
+        values[(rand >= 0.70) & (rand < 0.85)] += 1.5 * self._std
+        outlier = rand >= 0.85
+        signs = 1.0 - 2.0 * rng.integers(0, 2, int(outlier.sum()))
+        values[outlier] += signs * 3.5 * self._std
+
+        rules = replay_rules(values, self._mean, self._inv_std,
+                             self._std, self._n >= 1)
+
+        run0 = self.run_number
+        self.run_number += n_frames
+
+        # Only the tail of the batch can survive in the window; splice
+        # it in after shifting out whatever the batch evicts
+        keep = min(n_frames, self.max_points)
+        drop = max(0, self._n + keep - self.max_points)
+        if drop:
+            self._times_buf[:self._n - drop] = self._times_buf[drop:self._n]
+            self._values_buf[:self._n - drop] = self._values_buf[drop:self._n]
+            self._n -= drop
+        self._times_buf[self._n:self._n + keep] = np.arange(
+            run0 + n_frames - keep + 1, run0 + n_frames + 1)
+        self._values_buf[self._n:self._n + keep] = values[n_frames - keep:]
+        self._n += keep
+
+        # Rebuild the accumulators from the final window; cheaper than
+        # replaying the per-point add/delete updates
+        window = self._values_buf[:self._n]
+        self._mean_acc = float(window.mean())
+        self._M2 = float(((window - self._mean_acc) ** 2).sum())
+
+        for i in np.flatnonzero(rules >= 0):
+            run = run0 + int(i) + 1
+            code = int(rules[i])
+            self._viol_run_hist.append(run)
+            self._viol_code_hist.append(code)
+            self._viol_value_hist.append(float(values[i]))
+            if len(self._viol_run_hist) > _MAX_VIOLATIONS:
+                del self._viol_run_hist[0]
+                del self._viol_code_hist[0]
+                del self._viol_value_hist[0]
+            self._viol_xs.append(run)
+            self._viol_ys.append(float(values[i]))
+            self._viol_display.appendleft(
+                f"  ⚠ Run {run}: {RULE_NAMES[code]}"
+                f" - {RULE_MESSAGES[code]}")
+        if len(self._viol_run_hist) > 0:
+            self._viol_text = ('Recent Westgard Violations:\n'
+                               + '\n'.join(self._viol_display))
+
+        self.update_statistics()
+
     def update_statistics(self):
         """Calculate current statistics"""
-        if len(self.values) < 3:
+        if self._n < 3:
             return
-        
-        values_array = np.array(list(self.values))
-        mean = np.mean(values_array)
-        sd = np.std(values_array, ddof=1)
+
+        mean = self._mean_acc
+        sd = (self._M2 / (self._n - 1)) ** 0.5
         cv = (sd / mean) * 100 if mean != 0 else 0
-        bias = ((mean - self.params['mean']) / self.params['mean']) * 100
-        
-        tea_pct = self.params['tea'] * 100
-        sigma = (tea_pct - abs(bias)) / cv if cv > 0 else 0
+        bias = (mean - self._mean) / self._mean * 100
+
+        sigma = (self._tea_pct - abs(bias)) / cv if cv > 0 else 0
         
         self.current_stats = {
             'mean': mean,
@@ -107,143 +404,123 @@ class RealtimeQCMonitor:
         # Generate new measurement
         self.run_number += 1
         new_value = self.generate_measurement()
-        current_time = datetime.now()
-        
-        self.times.append(self.run_number)
-        self.values.append(new_value)
-        
-        # Check for violations
-        violation = self.check_westgard(new_value)
-        if violation:
-            violation['time'] = current_time
-            violation['value'] = new_value
-            violation['run'] = self.run_number
-            self.violations.append(violation)
-        
+
+        t = time.time()
+        sec = int(t)
+        if sec != self._last_sec:
+            self._time_str = time.strftime('%H:%M:%S', time.localtime(t))
+            self._last_sec = sec
+
+        self._append(self.run_number, new_value)
+
+        # Fused Welford accumulation and Westgard check in one kernel
+        # call; the rule code maps to a name/message only on violation
+        rule, self._mean_acc, self._M2 = westgard_and_update(
+            new_value, self._values_buf[self._n - 1], self._n >= 2,
+            self._mean, self._inv_std, self._std,
+            self._mean_acc, self._M2, self._n)
+        if rule >= 0:
+            self._viol_run_hist.append(self.run_number)
+            self._viol_code_hist.append(rule)
+            self._viol_value_hist.append(new_value)
+            if len(self._viol_run_hist) > _MAX_VIOLATIONS:
+                del self._viol_run_hist[0]
+                del self._viol_code_hist[0]
+                del self._viol_value_hist[0]
+            self._viol_xs.append(self.run_number)
+            self._viol_ys.append(new_value)
+            self._viol_display.appendleft(
+                f"  ⚠ Run {self.run_number}: {RULE_NAMES[rule]}"
+                f" - {RULE_MESSAGES[rule]}")
+            self._viol_text = ('Recent Westgard Violations:\n'
+                               + '\n'.join(self._viol_display))
+
         # Update statistics
         self.update_statistics()
-        
-        # Clear axes
-        self.ax1.clear()
-        self.ax2.clear()
-        
-        # Plot 1: Levey-Jennings Chart
-        mean = self.params['mean']
-        std = self.params['std']
-        
-        # Plot data
-        times_list = list(self.times)
-        values_list = list(self.values)
-        
-        self.ax1.plot(times_list, values_list, 'o-', 
-                     color='steelblue', markersize=8, linewidth=2, label='Measurements')
-        
-        # Control limits
-        self.ax1.axhline(y=mean, color='green', linestyle='-', linewidth=2, label='Mean')
-        self.ax1.axhline(y=mean + std, color='yellow', linestyle='--', linewidth=1.5, label='±1 SD')
-        self.ax1.axhline(y=mean - std, color='yellow', linestyle='--', linewidth=1.5)
-        self.ax1.axhline(y=mean + 2*std, color='orange', linestyle='--', linewidth=1.5, label='±2 SD')
-        self.ax1.axhline(y=mean - 2*std, color='orange', linestyle='--', linewidth=1.5)
-        self.ax1.axhline(y=mean + 3*std, color='red', linestyle='-', linewidth=2, label='±3 SD')
-        self.ax1.axhline(y=mean - 3*std, color='red', linestyle='-', linewidth=2)
-        
-        # Highlight violations
-        for v in self.violations:
-            if v['run'] in times_list:
-                idx = times_list.index(v['run'])
-                self.ax1.plot(v['run'], values_list[idx], 'rx', 
-                            markersize=15, markeredgewidth=3)
-        
-        self.ax1.set_xlabel('Run Number', fontsize=12, fontweight='bold')
-        self.ax1.set_ylabel(f'{self.analyte.capitalize()} ({self.params["unit"]})', 
-                           fontsize=12, fontweight='bold')
-        self.ax1.set_title('Levey-Jennings Chart', fontsize=14, fontweight='bold')
-        self.ax1.legend(loc='upper right', fontsize=10)
-        self.ax1.grid(True, alpha=0.3)
-        
-        # Plot 2: Statistics Dashboard
-        self.ax2.axis('off')
-        
-        # Title
-        self.ax2.text(0.5, 0.95, 'Real-Time Statistics & Alerts', 
-                     ha='center', va='top', fontsize=14, fontweight='bold',
-                     transform=self.ax2.transAxes)
-        
-        # Statistics table
-        stats_text = f"""
-Run Number: {self.run_number}
-Last Update: {current_time.strftime('%H:%M:%S')}
-
-Current Statistics:
-  Mean:  {self.current_stats['mean']:.4f} {self.params['unit']}
-  SD:    {self.current_stats['sd']:.4f}
-  CV:    {self.current_stats['cv']:.2f}%
-  Bias:  {self.current_stats['bias']:.2f}%
-  Sigma: {self.current_stats['sigma']:.2f}
-
-Target Values:
-  Mean:  {self.params['mean']:.4f} {self.params['unit']}
-  SD:    {self.params['std']:.4f}
-  TEa:   {self.params['tea']*100:.1f}%
-"""
-        
-        self.ax2.text(0.05, 0.85, stats_text, ha='left', va='top', 
-                     fontsize=11, family='monospace',
-                     transform=self.ax2.transAxes)
-        
+
+        # Hidden window: the buffers above are current, rendering would
+        # be thrown away
+        if not self._visible:
+            return ()
+
+        # Plot 1: Levey-Jennings Chart — update the persistent line and
+        # violation markers, then rescale to the new data window
+        times, values = self.window()
+
+        self.trend_line.set_data(times, values)
+        self.markers.set_data(times[:-1], values[:-1])
+        self.current_marker.set_data(times[-1:], values[-1:])
+
+        # Highlight violations: coordinates were stored at detection
+        # time, so just drop the ones that scrolled out of the window
+        t0 = times[0]
+        while self._viol_xs and self._viol_xs[0] < t0:
+            self._viol_xs.popleft()
+            self._viol_ys.popleft()
+        self.violation_scatter.set_offsets(
+            np.c_[self._viol_xs, self._viol_ys] if self._viol_xs
+            else np.empty((0, 2)))
+
+        xlim = self.ax1.get_xlim()
+        ylim = self.ax1.get_ylim()
+        self.ax1.relim()
+        self.ax1.autoscale_view()
+        limits_changed = (self.ax1.get_xlim() != xlim
+                          or self.ax1.get_ylim() != ylim)
+
+        # Plot 2: Statistics Dashboard — re-render the table only when
+        # a displayed value actually changed
+        s = self.current_stats
+        time_str = self._time_str
+        stats_key = (self.run_number, time_str, round(s['mean'], 4),
+                     round(s['sd'], 4), round(s['cv'], 2),
+                     round(s['bias'], 2), round(s['sigma'], 2))
+        if stats_key != self._last_stats_key:
+            self.stats_text.set_text(self._stats_tmpl(
+                run=self.run_number, time=time_str, mean=s['mean'],
+                sd=s['sd'], cv=s['cv'], bias=s['bias'], sigma=s['sigma']))
+            self._last_stats_key = stats_key
+
         # Sigma quality indicator
-        sigma = self.current_stats['sigma']
-        if sigma >= 6:
-            sigma_color = 'green'
-            sigma_label = 'World Class'
-        elif sigma >= 5:
-            sigma_color = 'lightgreen'
-            sigma_label = 'Excellent'
-        elif sigma >= 4:
-            sigma_color = 'yellow'
-            sigma_label = 'Good'
-        elif sigma >= 3:
-            sigma_color = 'orange'
-            sigma_label = 'Marginal'
-        else:
-            sigma_color = 'red'
-            sigma_label = 'Poor'
-        
+        tier = bisect_right(_SIGMA_BINS, self.current_stats['sigma'])
+        sigma_color = _SIGMA_COLORS[tier]
+        sigma_label = _SIGMA_LABELS[tier]
+
         # Sigma box
-        sigma_rect = Rectangle((0.55, 0.70), 0.4, 0.15, 
-                               facecolor=sigma_color, alpha=0.3,
-                               transform=self.ax2.transAxes)
-        self.ax2.add_patch(sigma_rect)
-        self.ax2.text(0.75, 0.775, f'Quality: {sigma_label}', 
-                     ha='center', va='center', fontsize=12, fontweight='bold',
-                     transform=self.ax2.transAxes)
-        
-        # Recent violations
-        violations_text = 'Recent Westgard Violations:\n'
-        if len(self.violations) == 0:
-            violations_text += '  ✓ No violations detected'
-            alert_color = 'lightgreen'
-        else:
-            recent = self.violations[-5:]  # Last 5
-            for v in reversed(recent):
-                violations_text += f"  ⚠ Run {v['run']}: {v['rule']} - {v['message']}\n"
-            alert_color = 'lightcoral'
-        
+        self.sigma_rect.set_facecolor(sigma_color)
+        self.sigma_label_text.set_text(f'Quality: {sigma_label}')
+
+        # Recent violations: the display string is maintained as
+        # violations arrive, so frames only hand it to the artist
+        alert_color = 'lightcoral' if self._viol_run_hist else 'lightgreen'
+
         # Alert box
-        alert_rect = Rectangle((0.05, 0.05), 0.9, 0.35, 
-                               facecolor=alert_color, alpha=0.3,
-                               transform=self.ax2.transAxes)
-        self.ax2.add_patch(alert_rect)
-        self.ax2.text(0.5, 0.35, violations_text, 
-                     ha='center', va='top', fontsize=10, family='monospace',
-                     transform=self.ax2.transAxes)
-        
-        plt.tight_layout()
-        
+        self.alert_rect.set_facecolor(alert_color)
+        self.violations_text_artist.set_text(self._viol_text)
+
+        canvas = self.fig.canvas
+        if self._chart_bg is None or limits_changed:
+            # No background yet, or the view scrolled: a full draw is
+            # required; _on_draw recaptures the backgrounds from it
+            canvas.draw_idle()
+        else:
+            # Steady state: restore the cached backgrounds and composite
+            # only the animated artists
+            canvas.restore_region(self._chart_bg)
+            canvas.restore_region(self._panel_bg)
+            self._draw_animated()
+            canvas.blit(self.ax1.bbox)
+            canvas.blit(self.ax2.bbox)
+            canvas.flush_events()
+
     def run(self, interval=2000):
         """Start the real-time monitor"""
-        ani = animation.FuncAnimation(self.fig, self.animate, 
-                                     interval=interval, cache_frame_data=False)
+        # A plain canvas timer drives the frames: FuncAnimation's draw
+        # handling would repaint the whole figure each tick, while
+        # animate blits only the changed regions itself
+        self._timer = self.fig.canvas.new_timer(interval=interval)
+        self._timer.add_callback(self.animate, None)
+        self._timer.start()
         plt.show()
 
 
@@ -253,21 +530,48 @@ class DualRealtimeQCMonitor:
     def __init__(self, max_points=50):
         self.qc = LabQCAnalysis(seed=None)
         self.max_points = max_points
-        
-        # Data storage for both analytes
+
+        # Per-analyte constants precomputed once; the per-frame helpers
+        # read attributes off these instead of going through
+        # self.qc.parameters each call
+        self._cached = {}
+        for a in ('creatinine', 'urea'):
+            p = self.qc.parameters[a]
+            self._cached[a] = AnalyteCache(p['mean'], p['std'],
+                                           1.0 / p['std'], p['tea'] * 100,
+                                           p['unit'])
+
+        self._pool = _RandomPool()
+
+        # Stacked constants for the vectorized update: both analytes'
+        # z-scores come out of one array expression per frame
+        self._analytes = ('creatinine', 'urea')
+        self._means = np.array([self._cached[a].mean for a in self._analytes])
+        self._inv_stds = np.array([self._cached[a].inv_std
+                                   for a in self._analytes])
+
+        # Data storage for both analytes; violation coordinates are
+        # stored at detection time so the chart update never searches
+        # the window for them
         self.monitors = {
-            'creatinine': {
-                'times': deque(maxlen=max_points),
-                'values': deque(maxlen=max_points),
-                'violations': [],
-                'stats': {'mean': 0, 'sd': 0, 'cv': 0, 'bias': 0, 'sigma': 0}
-            },
-            'urea': {
+            analyte: {
                 'times': deque(maxlen=max_points),
                 'values': deque(maxlen=max_points),
-                'violations': [],
+                'viol_runs': array('l'),
+                'viol_codes': array('b'),
+                # Running total; the history arrays above are trimmed
+                # to _MAX_VIOLATIONS, so the banner cannot count them
+                'viol_count': 0,
+                'viol_display': deque(maxlen=3),
+                'viol_text': '\nViolations: 0',
+                'viol_xs': deque(maxlen=max_points),
+                'viol_ys': deque(maxlen=max_points),
+                'count': 0,
+                'mean_acc': 0.0,
+                'M2': 0.0,
                 'stats': {'mean': 0, 'sd': 0, 'cv': 0, 'bias': 0, 'sigma': 0}
             }
+            for analyte in self._analytes
         }
         
         self.run_number = 0
@@ -282,130 +586,186 @@ class DualRealtimeQCMonitor:
         self.ax_urea_chart = plt.subplot(2, 2, 2)
         self.ax_creat_stats = plt.subplot(2, 2, 3)
         self.ax_urea_stats = plt.subplot(2, 2, 4)
-    
+
+        # Persistent artists per analyte; plot_chart/plot_stats mutate
+        # these in place instead of clearing and rebuilding each panel
+        # (and its seven control-limit lines) every frame
+        self.artists = {}
+        for analyte, ax_chart, ax_stats, color in (
+                ('creatinine', self.ax_creat_chart, self.ax_creat_stats, 'steelblue'),
+                ('urea', self.ax_urea_chart, self.ax_urea_stats, 'purple')):
+            p = self._cached[analyte]
+            mean = p.mean
+            std = p.std
+
+            line, = ax_chart.plot([], [], 'o-', color=color, markersize=6,
+                                  linewidth=2, label='Measurements')
+
+            # Control limits are constant per analyte; draw them once
+            ax_chart.axhline(y=mean, color='green', linestyle='-', linewidth=2, alpha=0.7)
+            ax_chart.axhline(y=mean + std, color='yellow', linestyle='--', linewidth=1.5, alpha=0.7)
+            ax_chart.axhline(y=mean - std, color='yellow', linestyle='--', linewidth=1.5, alpha=0.7)
+            ax_chart.axhline(y=mean + 2*std, color='orange', linestyle='--', linewidth=1.5, alpha=0.7)
+            ax_chart.axhline(y=mean - 2*std, color='orange', linestyle='--', linewidth=1.5, alpha=0.7)
+            ax_chart.axhline(y=mean + 3*std, color='red', linestyle='-', linewidth=2, alpha=0.7)
+            ax_chart.axhline(y=mean - 3*std, color='red', linestyle='-', linewidth=2, alpha=0.7)
+
+            scatter = ax_chart.scatter([], [], marker='x', color='red',
+                                       s=144, linewidths=3, zorder=3)
+
+            ax_chart.set_xlabel('Run Number', fontsize=10, fontweight='bold')
+            ax_chart.set_ylabel(f'{analyte.capitalize()} ({p.unit})',
+                                fontsize=10, fontweight='bold')
+            ax_chart.set_title(f'{analyte.capitalize()} - Levey-Jennings Chart',
+                               fontsize=12, fontweight='bold')
+            ax_chart.grid(True, alpha=0.3)
+
+            ax_stats.axis('off')
+            stats_text = ax_stats.text(0.1, 0.9, '', ha='left', va='top',
+                                       fontsize=11, family='monospace',
+                                       transform=ax_stats.transAxes)
+            rect = Rectangle((0.1, 0.05), 0.8, 0.15, facecolor='lightgray',
+                             alpha=0.4, transform=ax_stats.transAxes)
+            ax_stats.add_patch(rect)
+            viol_text = ax_stats.text(0.1, 0.35, '', ha='left', va='top',
+                                      fontsize=10, family='monospace',
+                                      transform=ax_stats.transAxes)
+
+            self.artists[analyte] = {'line': line, 'scatter': scatter,
+                                     'stats_text': stats_text, 'rect': rect,
+                                     'viol_text': viol_text}
+
+        _watch_visibility(self, self.fig)
+
+        # Layout is fixed; measuring every artist again each frame is
+        # pure overhead, so compute it exactly once
+        self.fig.tight_layout(rect=[0, 0, 1, 0.96])
+
     def generate_measurement(self, analyte):
         """Generate a new measurement"""
-        params = self.qc.parameters[analyte]
-        rand = np.random.random()
-        
+        p = self._cached[analyte]
+        rand = self._pool.uniform()
+
         if rand < 0.70:  # Normal
-            value = np.random.normal(params['mean'], params['std'])
+            value = p.mean + self._pool.normal() * p.std
         elif rand < 0.85:  # Systematic shift
-            value = np.random.normal(params['mean'] + 1.5 * params['std'], params['std'])
+            value = p.mean + 1.5 * p.std + self._pool.normal() * p.std
         else:  # Outlier
-            value = np.random.normal(params['mean'], params['std'])
-            value += np.random.choice([-1, 1]) * 3.5 * params['std']
-        
+            value = p.mean + self._pool.normal() * p.std
+            value += self._pool.sign() * 3.5 * p.std
+
         return value
     
-    def check_westgard(self, analyte, new_value):
-        """Quick Westgard rule check"""
+    def check_westgard(self, analyte, new_value, z_score=None):
+        """Quick Westgard rule check
+
+        ``z_score`` may be passed in when the caller already computed it
+        (the animate loop gets both analytes' z-scores from one
+        vectorized expression).
+        """
         monitor = self.monitors[analyte]
         values = monitor['values']
-        
+
         if len(values) < 2:
-            return None
-        
-        params = self.qc.parameters[analyte]
-        mean = params['mean']
-        std = params['std']
-        z_score = (new_value - mean) / std
-        
+            return -1
+
+        p = self._cached[analyte]
+        if z_score is None:
+            z_score = (new_value - p.mean) * p.inv_std
+
         # Rule 1-3s
         if abs(z_score) > 3:
-            return {'rule': '1-3s', 'severity': 'CRITICAL'}
-        
+            return 0
+
         # Rule 2-2s
         if len(values) >= 1:
-            z_prev = (values[-1] - mean) / std
+            z_prev = (values[-1] - p.mean) * p.inv_std
             if abs(z_score) > 2 and abs(z_prev) > 2 and np.sign(z_score) == np.sign(z_prev):
-                return {'rule': '2-2s', 'severity': 'CRITICAL'}
-        
-        return None
+                return 1
+
+        return -1
     
+    def push_value(self, analyte, x):
+        """Append a measurement and fold it into the running statistics
+
+        The window statistics live in Welford accumulators, so pushing a
+        point costs O(1); when the bounded deque evicts its oldest point
+        the accumulators are rewound with the symmetric deletion update.
+        """
+        monitor = self.monitors[analyte]
+        values = monitor['values']
+
+        # Evict the point the full deque is about to drop
+        if len(values) == self.max_points:
+            old = values[0]
+            delta = old - monitor['mean_acc']
+            monitor['mean_acc'] -= delta / (monitor['count'] - 1)
+            monitor['M2'] -= delta * (old - monitor['mean_acc'])
+            if monitor['M2'] < 0.0:  # guard against round-off drift
+                monitor['M2'] = 0.0
+            monitor['count'] -= 1
+
+        values.append(x)
+        monitor['count'] += 1
+        delta = x - monitor['mean_acc']
+        monitor['mean_acc'] += delta / monitor['count']
+        monitor['M2'] += delta * (x - monitor['mean_acc'])
+
+        self.update_statistics(analyte)
+
     def update_statistics(self, analyte):
-        """Calculate current statistics"""
+        """Calculate current statistics from the running accumulators"""
         monitor = self.monitors[analyte]
-        values = list(monitor['values'])
-        
-        if len(values) < 3:
+        n = monitor['count']
+
+        if n < 3:
             return
-        
-        params = self.qc.parameters[analyte]
-        values_array = np.array(values)
-        mean = np.mean(values_array)
-        sd = np.std(values_array, ddof=1)
+
+        p = self._cached[analyte]
+        mean = monitor['mean_acc']
+        sd = (monitor['M2'] / (n - 1)) ** 0.5
         cv = (sd / mean) * 100 if mean != 0 else 0
-        bias = ((mean - params['mean']) / params['mean']) * 100
-        
-        tea_pct = params['tea'] * 100
-        sigma = (tea_pct - abs(bias)) / cv if cv > 0 else 0
-        
+        bias = (mean - p.mean) / p.mean * 100
+
+        sigma = (p.tea_pct - abs(bias)) / cv if cv > 0 else 0
+
         monitor['stats'] = {'mean': mean, 'sd': sd, 'cv': cv, 'bias': bias, 'sigma': sigma}
     
     def plot_chart(self, ax, analyte, color):
-        """Plot Levey-Jennings chart for one analyte"""
-        ax.clear()
-        
+        """Update the Levey-Jennings chart for one analyte"""
         monitor = self.monitors[analyte]
-        params = self.qc.parameters[analyte]
-        mean = params['mean']
-        std = params['std']
-        
-        times_list = list(monitor['times'])
-        values_list = list(monitor['values'])
-        
-        if len(times_list) > 0:
-            ax.plot(times_list, values_list, 'o-', color=color, 
-                   markersize=6, linewidth=2, label='Measurements')
-        
-        # Control limits
-        ax.axhline(y=mean, color='green', linestyle='-', linewidth=2, alpha=0.7)
-        ax.axhline(y=mean + std, color='yellow', linestyle='--', linewidth=1.5, alpha=0.7)
-        ax.axhline(y=mean - std, color='yellow', linestyle='--', linewidth=1.5, alpha=0.7)
-        ax.axhline(y=mean + 2*std, color='orange', linestyle='--', linewidth=1.5, alpha=0.7)
-        ax.axhline(y=mean - 2*std, color='orange', linestyle='--', linewidth=1.5, alpha=0.7)
-        ax.axhline(y=mean + 3*std, color='red', linestyle='-', linewidth=2, alpha=0.7)
-        ax.axhline(y=mean - 3*std, color='red', linestyle='-', linewidth=2, alpha=0.7)
-        
-        # Violations
-        for v in monitor['violations']:
-            if v['run'] in times_list:
-                idx = times_list.index(v['run'])
-                ax.plot(v['run'], values_list[idx], 'rx', markersize=12, markeredgewidth=3)
-        
-        ax.set_xlabel('Run Number', fontsize=10, fontweight='bold')
-        ax.set_ylabel(f'{analyte.capitalize()} ({params["unit"]})', fontsize=10, fontweight='bold')
-        ax.set_title(f'{analyte.capitalize()} - Levey-Jennings Chart', fontsize=12, fontweight='bold')
-        ax.grid(True, alpha=0.3)
-    
+        art = self.artists[analyte]
+
+        # set_data takes any sequence; handing it the deques directly
+        # skips two ~50-element list copies per analyte per frame
+        times = monitor['times']
+        art['line'].set_data(times, monitor['values'])
+
+        # Violations: drop coordinates that scrolled out of the window
+        viol_xs, viol_ys = monitor['viol_xs'], monitor['viol_ys']
+        if times:
+            t0 = times[0]
+            while viol_xs and viol_xs[0] < t0:
+                viol_xs.popleft()
+                viol_ys.popleft()
+        art['scatter'].set_offsets(
+            np.c_[viol_xs, viol_ys] if viol_xs else np.empty((0, 2)))
+
+        ax.relim()
+        ax.autoscale_view()
+
     def plot_stats(self, ax, analyte):
-        """Plot statistics panel"""
-        ax.clear()
-        ax.axis('off')
-        
+        """Update the statistics panel"""
         monitor = self.monitors[analyte]
-        params = self.qc.parameters[analyte]
+        art = self.artists[analyte]
         stats = monitor['stats']
-        
+
         # Sigma quality
         sigma = stats['sigma']
-        if sigma >= 6:
-            sigma_color = 'green'
-            sigma_label = 'World Class'
-        elif sigma >= 5:
-            sigma_color = 'lightgreen'
-            sigma_label = 'Excellent'
-        elif sigma >= 4:
-            sigma_color = 'yellow'
-            sigma_label = 'Good'
-        elif sigma >= 3:
-            sigma_color = 'orange'
-            sigma_label = 'Marginal'
-        else:
-            sigma_color = 'red'
-            sigma_label = 'Poor'
-        
+        tier = bisect_right(_SIGMA_BINS, sigma)
+        sigma_color = _SIGMA_COLORS[tier]
+        sigma_label = _SIGMA_LABELS[tier]
+
         stats_text = f"{analyte.upper()} Statistics\n\n"
         stats_text += f"Run: {self.run_number}\n"
         stats_text += f"Mean:  {stats['mean']:.4f}\n"
@@ -414,55 +774,59 @@ class DualRealtimeQCMonitor:
         stats_text += f"Bias:  {stats['bias']:.2f}%\n"
         stats_text += f"Sigma: {sigma:.2f}\n"
         stats_text += f"Quality: {sigma_label}"
-        
-        ax.text(0.1, 0.9, stats_text, ha='left', va='top', 
-               fontsize=11, family='monospace', transform=ax.transAxes)
-        
+
+        art['stats_text'].set_text(stats_text)
+
         # Quality box
-        rect = Rectangle((0.1, 0.05), 0.8, 0.15, 
-                        facecolor=sigma_color, alpha=0.4, transform=ax.transAxes)
-        ax.add_patch(rect)
-        
-        # Violations
-        violations_text = f"\nViolations: {len(monitor['violations'])}"
-        if len(monitor['violations']) > 0:
-            recent = monitor['violations'][-3:]
-            for v in reversed(recent):
-                violations_text += f"\n  Run {v['run']}: {v['rule']}"
-        
-        ax.text(0.1, 0.35, violations_text, ha='left', va='top',
-               fontsize=10, family='monospace', transform=ax.transAxes)
+        art['rect'].set_facecolor(sigma_color)
+
+        # Violations: the display string is maintained as violations
+        # arrive, so the per-frame work is a single set_text
+        art['viol_text'].set_text(monitor['viol_text'])
     
     def animate(self, frame):
         """Animation function"""
         self.run_number += 1
-        
+
+        # One vectorized shot for both analytes' z-scores
+        new_values = np.array([self.generate_measurement(a)
+                               for a in self._analytes])
+        z_scores = (new_values - self._means) * self._inv_stds
+
         # Update both analytes
-        for analyte in ['creatinine', 'urea']:
+        for analyte, new_value, z_score in zip(self._analytes, new_values,
+                                               z_scores):
             monitor = self.monitors[analyte]
-            
-            # Generate measurement
-            new_value = self.generate_measurement(analyte)
+
             monitor['times'].append(self.run_number)
-            monitor['values'].append(new_value)
-            
+            self.push_value(analyte, new_value)
+
             # Check violations
-            violation = self.check_westgard(analyte, new_value)
-            if violation:
-                violation['run'] = self.run_number
-                violation['value'] = new_value
-                monitor['violations'].append(violation)
-            
-            # Update statistics
-            self.update_statistics(analyte)
-        
+            code = self.check_westgard(analyte, new_value, z_score)
+            if code >= 0:
+                monitor['viol_runs'].append(self.run_number)
+                monitor['viol_codes'].append(code)
+                monitor['viol_count'] += 1
+                if len(monitor['viol_runs']) > _MAX_VIOLATIONS:
+                    del monitor['viol_runs'][0]
+                    del monitor['viol_codes'][0]
+                monitor['viol_xs'].append(self.run_number)
+                monitor['viol_ys'].append(new_value)
+                monitor['viol_display'].appendleft(
+                    f"\n  Run {self.run_number}: {RULE_NAMES[code]}")
+                monitor['viol_text'] = (
+                    f"\nViolations: {monitor['viol_count']}"
+                    + ''.join(monitor['viol_display']))
+
+        # Hidden window: keep the buffers current, skip the draw work
+        if not self._visible:
+            return
+
         # Plot all panels
         self.plot_chart(self.ax_creat_chart, 'creatinine', 'steelblue')
         self.plot_chart(self.ax_urea_chart, 'urea', 'purple')
         self.plot_stats(self.ax_creat_stats, 'creatinine')
         self.plot_stats(self.ax_urea_stats, 'urea')
-        
-        plt.tight_layout(rect=[0, 0, 1, 0.96])
     
     def run(self, interval=2000):
         """Start the dual monitor"""
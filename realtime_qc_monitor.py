@@ -5,31 +5,142 @@ Simulates real-time data streaming and automatic Westgard rule checking
 """
 
 import dash
-from dash import dcc, html, Input, Output, State
+from dash import ClientsideFunction, dcc, html, Input, Output, State
+from dash.exceptions import PreventUpdate
 import plotly.graph_objs as go
 from plotly.subplots import make_subplots
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from collections import deque
+from collections import deque, namedtuple
+import asyncio
+import csv
+from heapq import nlargest
+import io
+import random
+from itertools import chain, repeat
 import threading
 import time
 from lab_qc_analysis import LabQCAnalysis
+from qc_kernels import westgard_full
+
+# orjson is optional; when present it takes over the server's JSON
+# encoding, which is the steady per-callback cost once the compute is
+# out of the way
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+except ImportError:
+    orjson = None
 
 # Initialize
 qc = LabQCAnalysis(seed=None)  # Random seed for varying data
 
-# Global data storage (thread-safe)
+# Per-analyte constants resolved once at import; attribute access on a
+# namedtuple is C-level and skips the nested dict hashing the hot
+# paths would otherwise redo on every measurement
+_Params = namedtuple('_Params', ('mean', 'std', 'inv_std', 'tea_pct', 'unit'))
+_PARAMS = {a: _Params(cfg['mean'], cfg['std'], 1.0 / cfg['std'],
+                      cfg['tea'] * 100, cfg['unit'])
+           for a, cfg in qc.parameters.items()}
+
+# One PCG64 generator for all simulation draws, plus stacked target
+# vectors so each tick draws both analytes in a single call
+rng = np.random.default_rng()
+_ANALYTES = ('creatinine', 'urea')
+_MU_VEC = np.array([_PARAMS[a].mean for a in _ANALYTES])
+_SD_VEC = np.array([_PARAMS[a].std for a in _ANALYTES])
+
+# The generator thread writes while Flask worker threads read; one lock
+# per analyte keeps the times/values/violations triple consistent.
+# Callers that need both analytes acquire them in _ANALYTES order.
+_locks = {a: threading.Lock() for a in _ANALYTES}
+
+
+class _Window:
+    """Sliding measurement window on preallocated NumPy storage
+
+    Replaces the deque pair: times()/values() hand out ordered
+    zero-copy views, so the rule check and statistics run vectorized
+    without a per-call list() rebuild. When full, eviction shifts the
+    buffers left one slot — cheaper than unwrapping a circular buffer
+    for every chart and export consumer that needs ordered data.
+    Running mean and M2 are maintained with Welford updates (West's
+    deletion on eviction), so window statistics are O(1) reads.
+    """
+
+    def __init__(self, size):
+        self._times = np.empty(size, dtype='datetime64[ms]')
+        self._values = np.empty(size, dtype=np.float64)
+        # z-scores stored alongside, so the rule check never recomputes
+        # (value - mean) / std for points already in the window
+        self._z = np.empty(size, dtype=np.float64)
+        self.size = size
+        self.n = 0
+        # Total points ever appended; unlike n it keeps growing after
+        # the window fills, so consumers can detect new arrivals
+        self.total = 0
+        self.m = 0.0
+        self.m2 = 0.0
+
+    def __len__(self):
+        return self.n
+
+    def append(self, t, value, z):
+        if self.n == self.size:
+            # Remove the evicted point's contribution in O(1)
+            old = self._values[0]
+            delta = old - self.m
+            self.m -= delta / (self.n - 1)
+            self.m2 -= delta * (old - self.m)
+            if self.m2 < 0.0:  # guard against round-off drift
+                self.m2 = 0.0
+            self._times[:-1] = self._times[1:]
+            self._values[:-1] = self._values[1:]
+            self._z[:-1] = self._z[1:]
+            self.n -= 1
+        self._times[self.n] = t
+        self._values[self.n] = value
+        self._z[self.n] = z
+        self.n += 1
+        self.total += 1
+        delta = value - self.m
+        self.m += delta / self.n
+        self.m2 += delta * (value - self.m)
+
+    def sd(self):
+        return (self.m2 / (self.n - 1)) ** 0.5 if self.n >= 2 else 0.0
+
+    def times(self):
+        return self._times[:self.n]
+
+    def values(self):
+        return self._values[:self.n]
+
+    def z(self):
+        return self._z[:self.n]
+
+    def snapshot(self):
+        """Consistent (times, values) copies for use outside the lock"""
+        return self._times[:self.n].copy(), self._values[:self.n].copy()
+
+    def clear(self):
+        self.n = 0
+        # total is left alone: the per-client new-point dedup compares
+        # against it, so it must never move backward — a reset could
+        # otherwise land it exactly on a client's last-seen value
+        self.m = 0.0
+        self.m2 = 0.0
+
+
+# Global data storage (single writer: the generator thread)
 max_points = 100
 data_storage = {
     'creatinine': {
-        'times': deque(maxlen=max_points),
-        'values': deque(maxlen=max_points),
+        'window': _Window(max_points),
         'violations': deque(maxlen=50)
     },
     'urea': {
-        'times': deque(maxlen=max_points),
-        'values': deque(maxlen=max_points),
+        'window': _Window(max_points),
         'violations': deque(maxlen=50)
     }
 }
@@ -40,6 +151,10 @@ stats_storage = {
     'urea': {'mean': 0, 'sd': 0, 'cv': 0, 'bias': 0, 'sigma': 0}
 }
 
+# Bumped by the generator after each batch of measurements; interval
+# callbacks compare against it and skip ticks that carry no new data
+_data_version = [0]
+
 # Alert flags
 alert_flags = {
     'creatinine': {'status': 'OK', 'message': '', 'count': 0},
@@ -48,118 +163,83 @@ alert_flags = {
 
 def generate_new_measurement(analyte, add_shift=False, add_outlier=False):
     """Generate a new simulated measurement"""
-    params = qc.parameters[analyte]
+    p = _PARAMS[analyte]
     
     # Base value
-    value = np.random.normal(params['mean'], params['std'])
+    value = rng.normal(p.mean, p.std)
     
     # Add systematic shift if requested
     if add_shift:
-        value += params['std'] * 1.5
+        value += p.std * 1.5
     
     # Add outlier if requested
     if add_outlier:
-        value += np.random.choice([-1, 1]) * params['std'] * 3.5
+        value += (1.0 - 2.0 * rng.integers(0, 2)) * p.std * 3.5
     
     return value
 
 
-def check_westgard_violation(analyte, new_value):
-    """Check if new value violates Westgard rules"""
-    params = qc.parameters[analyte]
-    mean = params['mean']
-    std = params['std']
-    
-    storage = data_storage[analyte]
-    values = list(storage['values'])
-    
-    if len(values) < 2:
+# Rule metadata indexed by the kernel's return code; built here, not
+# in the kernel, so the hot path never touches strings
+_RULE_META = (
+    None,
+    ('1-3s', 'CRITICAL', 'One control exceeds ±3 SD'),
+    ('2-2s', 'CRITICAL', 'Two consecutive controls exceed ±2 SD'),
+    ('R-4s', 'CRITICAL', 'Range exceeds 4 SD'),
+    ('4-1s', 'WARNING', 'Four consecutive controls exceed ±1 SD'),
+    ('10-x', 'CRITICAL', '10 consecutive controls on same side of mean'),
+)
+
+
+def check_westgard_violation(analyte, new_value, now=None):
+    """Check if new value violates Westgard rules
+
+    The numeric ladder lives in qc_kernels.westgard_full — compiled
+    when numba is available, so the generator thread spends no GIL
+    time on rule arithmetic — and only a violation pays for the dict
+    and message strings. ``now`` lets the generator reuse its tick
+    timestamp instead of taking another clock reading per rule hit.
+    """
+    p = _PARAMS[analyte]
+
+    window = data_storage[analyte]['window']
+    code = westgard_full(new_value, window.values(), window.z(),
+                         p.mean, p.std)
+    if code == 0:
         return None
-    
-    z_score = (new_value - mean) / std
-    
-    # Rule 1-3s
-    if abs(z_score) > 3:
-        return {
-            'time': datetime.now(),
-            'value': new_value,
-            'rule': '1-3s',
-            'severity': 'CRITICAL',
-            'message': 'One control exceeds ±3 SD'
-        }
-    
-    # Rule 2-2s
-    if len(values) >= 1:
-        z_prev = (values[-1] - mean) / std
-        if abs(z_score) > 2 and abs(z_prev) > 2:
-            if np.sign(z_score) == np.sign(z_prev):
-                return {
-                    'time': datetime.now(),
-                    'value': new_value,
-                    'rule': '2-2s',
-                    'severity': 'CRITICAL',
-                    'message': 'Two consecutive controls exceed ±2 SD'
-                }
-    
-    # Rule R-4s
-    if len(values) >= 1:
-        range_val = abs(new_value - values[-1])
-        if range_val > 4 * std:
-            return {
-                'time': datetime.now(),
-                'value': new_value,
-                'rule': 'R-4s',
-                'severity': 'CRITICAL',
-                'message': 'Range exceeds 4 SD'
-            }
-    
-    # Rule 4-1s
-    if len(values) >= 3:
-        last_4_z = [z_score] + [(values[i] - mean) / std for i in range(-3, 0)]
-        if all(z > 1 for z in last_4_z) or all(z < -1 for z in last_4_z):
-            return {
-                'time': datetime.now(),
-                'value': new_value,
-                'rule': '4-1s',
-                'severity': 'WARNING',
-                'message': 'Four consecutive controls exceed ±1 SD'
-            }
-    
-    # Rule 10-x
-    if len(values) >= 9:
-        last_10 = [new_value] + values[-9:]
-        if all(val > mean for val in last_10) or all(val < mean for val in last_10):
-            return {
-                'time': datetime.now(),
-                'value': new_value,
-                'rule': '10-x',
-                'severity': 'CRITICAL',
-                'message': '10 consecutive controls on same side of mean'
-            }
-    
-    return None
+
+    rule, severity, message = _RULE_META[code]
+    return {
+        'time': now if now is not None else datetime.now(),
+        'value': new_value,
+        'rule': rule,
+        'severity': severity,
+        'message': message
+    }
 
 
 def update_statistics(analyte):
-    """Calculate current statistics"""
-    storage = data_storage[analyte]
-    values = list(storage['values'])
-    
-    if len(values) < 3:
+    """Refresh the stats snapshot from the window's running moments
+
+    O(1): the window maintains mean and M2 incrementally, so nothing
+    is copied or re-reduced here. stats_storage stays as the plain
+    dict the callbacks serialize.
+    """
+    window = data_storage[analyte]['window']
+
+    if len(window) < 3:
         return
-    
-    params = qc.parameters[analyte]
-    values_array = np.array(values)
-    
-    mean = np.mean(values_array)
-    sd = np.std(values_array, ddof=1)
+
+    p = _PARAMS[analyte]
+
+    mean = window.m
+    sd = window.sd()
     cv = (sd / mean) * 100 if mean != 0 else 0
-    bias = ((mean - params['mean']) / params['mean']) * 100
+    bias = ((mean - p.mean) / p.mean) * 100
     
     # Calculate Sigma
-    tea_pct = params['tea'] * 100
     if cv > 0:
-        sigma = (tea_pct - abs(bias)) / cv
+        sigma = (p.tea_pct - abs(bias)) / cv
     else:
         sigma = 0
     
@@ -169,42 +249,44 @@ def update_statistics(analyte):
         'cv': cv,
         'bias': bias,
         'sigma': sigma,
-        'n': len(values)
+        'n': len(window)
     }
 
 
-def data_generator():
-    """Background thread to generate new data points"""
-    simulation_scenarios = {
-        'normal': {'shift': False, 'outlier': False, 'weight': 0.7},
-        'shift': {'shift': True, 'outlier': False, 'weight': 0.15},
-        'outlier': {'shift': False, 'outlier': True, 'weight': 0.15}
-    }
-    
-    while True:
-        # Choose scenario
-        scenario_type = np.random.choice(
-            list(simulation_scenarios.keys()),
-            p=[s['weight'] for s in simulation_scenarios.values()]
-        )
-        scenario = simulation_scenarios[scenario_type]
-        
-        # Generate measurements for both analytes
-        for analyte in ['creatinine', 'urea']:
-            new_value = generate_new_measurement(
-                analyte, 
-                add_shift=scenario['shift'],
-                add_outlier=scenario['outlier']
-            )
-            
-            current_time = datetime.now()
-            
-            # Store data
-            data_storage[analyte]['times'].append(current_time)
-            data_storage[analyte]['values'].append(new_value)
-            
+# Scenario mix as (add_shift, add_outlier) pairs: 70% normal, 15%
+# systematic shift, 15% outlier
+_SCENARIOS = ((False, False), (True, False), (False, True))
+
+
+def _tick():
+    """Generate and process one batch of measurements"""
+    # Choose scenario: one uniform draw against fixed thresholds
+    # instead of np.random.choice re-parsing keys and weights
+    r = random.random()
+    add_shift, add_outlier = _SCENARIOS[0 if r < 0.70 else
+                                        1 if r < 0.85 else 2]
+
+    # Draw both analytes in one call; shift and outlier offsets
+    # apply vectorized on top of the base draw
+    new_values = rng.normal(_MU_VEC, _SD_VEC)
+    if add_shift:
+        new_values += _SD_VEC * 1.5
+    if add_outlier:
+        new_values += (1.0 - 2.0 * rng.integers(0, 2, 2)) * _SD_VEC * 3.5
+
+    # One clock reading per tick, shared by storage and any
+    # violation records both analytes produce
+    now = datetime.now()
+
+    for analyte, new_value in zip(_ANALYTES, new_values):
+        with _locks[analyte]:
+            # Store data, with the z-score the rule checks will read
+            p = _PARAMS[analyte]
+            data_storage[analyte]['window'].append(
+                now, new_value, (new_value - p.mean) * p.inv_std)
+
             # Check for violations
-            violation = check_westgard_violation(analyte, new_value)
+            violation = check_westgard_violation(analyte, new_value, now)
             if violation:
                 data_storage[analyte]['violations'].append(violation)
                 alert_flags[analyte]['status'] = 'ALERT'
@@ -214,20 +296,132 @@ def data_generator():
                 if alert_flags[analyte]['count'] == 0:
                     alert_flags[analyte]['status'] = 'OK'
                     alert_flags[analyte]['message'] = 'All controls within limits'
-            
+
             # Update statistics
             update_statistics(analyte)
-        
-        # Wait before next measurement (simulate real-time)
-        time.sleep(2)  # New measurement every 2 seconds
+
+    _data_version[0] += 1
+
+
+async def data_loop():
+    """Produce a measurement batch every 2 seconds
+
+    Scheduled against the event-loop clock, so the cadence stays fixed
+    instead of drifting by each tick's processing time the way
+    work-then-time.sleep(2) did.
+    """
+    loop = asyncio.get_running_loop()
+    next_tick = loop.time()
+    while True:
+        _tick()
+        next_tick += 2.0  # New measurement every 2 seconds
+        await asyncio.sleep(max(0.0, next_tick - loop.time()))
+
+
+def data_generator():
+    """Background-thread entry point: run the data loop to completion"""
+    asyncio.run(data_loop())
+
+
+_CHART_COLORS = {'creatinine': '#3498db', 'urea': '#9b59b6'}
+
+
+def _build_limit_overlays(mean, std):
+    """Levey-Jennings control-limit shapes/annotations for one analyte
+
+    add_hline is only a builder for layout.shapes and
+    layout.annotations entries; running it on a throwaway figure once
+    at import harvests those entries so figure builds just assign them.
+    """
+    fig = go.Figure()
+    fig.add_hline(y=mean, line_dash="solid", line_color="green", line_width=2,
+                  annotation_text="Mean", annotation_position="right")
+    fig.add_hline(y=mean + std, line_dash="dash", line_color="yellow", line_width=1.5,
+                  annotation_text="+1 SD", annotation_position="right")
+    fig.add_hline(y=mean - std, line_dash="dash", line_color="yellow", line_width=1.5)
+    fig.add_hline(y=mean + 2*std, line_dash="dash", line_color="orange", line_width=1.5,
+                  annotation_text="+2 SD", annotation_position="right")
+    fig.add_hline(y=mean - 2*std, line_dash="dash", line_color="orange", line_width=1.5)
+    fig.add_hline(y=mean + 3*std, line_dash="solid", line_color="red", line_width=2,
+                  annotation_text="+3 SD", annotation_position="right")
+    fig.add_hline(y=mean - 3*std, line_dash="solid", line_color="red", line_width=2)
+    return fig.layout.shapes, fig.layout.annotations
+
+
+_STATIC_OVERLAYS = {
+    a: _build_limit_overlays(_PARAMS[a].mean, _PARAMS[a].std)
+    for a in _ANALYTES
+}
+
+
+def build_static_figure(analyte):
+    """Build the full Levey-Jennings figure for one analyte
+
+    Called once per page load: the control-limit lines and layout never
+    change, and the measurement trace is seeded with the current window
+    so the client starts with history. After that the trace grows
+    clientside via extendData — the server never rebuilds the figure.
+    """
+    with _locks[analyte]:
+        times, values = data_storage[analyte]['window'].snapshot()
+
+    fig = go.Figure()
+
+    fig.add_trace(go.Scatter(
+        x=times, y=values,
+        mode='lines+markers',
+        name='Measurements',
+        line=dict(color=_CHART_COLORS[analyte], width=2),
+        marker=dict(size=8)
+    ))
+
+    # Control limits, prebuilt at import
+    shapes, annotations = _STATIC_OVERLAYS[analyte]
+
+    fig.update_layout(
+        shapes=shapes,
+        annotations=annotations,
+        title=f'{analyte.capitalize()} - Real-Time Levey-Jennings Chart',
+        xaxis_title='Time',
+        yaxis_title=f'{analyte.capitalize()} ({_PARAMS[analyte].unit})',
+        hovermode='x unified',
+        plot_bgcolor='white',
+        paper_bgcolor='white',
+        font=dict(size=12)
+    )
+
+    return fig
 
 
 # Initialize Dash app
-app = dash.Dash(__name__, update_title='QC Monitor...')
+# update_title=None: no per-callback document-title churn
+app = dash.Dash(__name__, update_title=None)
 app.title = 'Laboratory QC Real-Time Monitor'
 
-# App layout
-app.layout = html.Div([
+if orjson is not None:
+    class _ORJSONProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson
+
+        2-4x faster encode per reply and fewer intermediate strings;
+        numpy scalars serialize natively and anything orjson does not
+        know falls back to Flask's default handler.
+        """
+
+        _OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj, default=self.default,
+                                option=self._OPTIONS).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.server.json = _ORJSONProvider(app.server)
+
+# App layout: served per request so each page load seeds the charts
+# with the data accumulated so far
+def serve_layout():
+    return html.Div([
     html.Div([
         html.H1('🔬 Laboratory QC Real-Time Monitoring Dashboard', 
                 style={'textAlign': 'center', 'color': '#2c3e50', 'marginBottom': 10}),
@@ -243,11 +437,13 @@ app.layout = html.Div([
     
     # Main Charts
     html.Div([
-        dcc.Graph(id='creatinine-chart', style={'height': '400px'}),
+        dcc.Graph(id='creatinine-chart', style={'height': '400px'},
+                  figure=build_static_figure('creatinine')),
     ], style={'marginBottom': '20px'}),
     
     html.Div([
-        dcc.Graph(id='urea-chart', style={'height': '400px'}),
+        dcc.Graph(id='urea-chart', style={'height': '400px'},
+                  figure=build_static_figure('urea')),
     ], style={'marginBottom': '20px'}),
     
     # Statistics Dashboard
@@ -268,7 +464,7 @@ app.layout = html.Div([
     # Auto-update interval
     dcc.Interval(
         id='interval-component',
-        interval=1000,  # Update every 1 second
+        interval=2000,  # Matched to the 2-second data cadence
         n_intervals=0
     ),
     
@@ -285,348 +481,192 @@ app.layout = html.Div([
     ], style={'textAlign': 'center', 'marginTop': '20px'}),
     
     dcc.Download(id='download-data'),
-    
+
+    # Authoritative per-tick snapshot — newest chart point, alert and
+    # stats state, violations-log refresh — rendered clientside in
+    # assets/qc.js. Swapping this store for a Redis-backed cache is
+    # the whole change needed to run multiple workers.
+    dcc.Store(id='qc-tick'),
+
 ], style={'padding': '20px', 'backgroundColor': '#f5f5f5', 'fontFamily': 'Arial, sans-serif'})
 
 
-@app.callback(
+app.layout = serve_layout
+
+
+def _state_payload():
+    """Alert/stats snapshot both panels render clientside
+
+    One small JSON object per tick replaces five Python callbacks that
+    each rebuilt an HTML component tree on the server.
+    """
+    state = {'ts': datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+    for analyte in _ANALYTES:
+        p = _PARAMS[analyte]
+        with _locks[analyte]:
+            alert = dict(alert_flags[analyte])
+            stats = dict(stats_storage[analyte])
+        state[analyte] = {
+            'alert': alert['status'],
+            'message': alert['message'],
+            'count': alert['count'],
+            'stats': stats,
+            'target': p.mean,
+            'unit': p.unit,
+        }
+    return state
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace='qc', function_name='renderTime'),
     Output('live-update-time', 'children'),
-    Input('interval-component', 'n_intervals')
+    Input('qc-tick', 'data'),
 )
-def update_time(n):
-    return f"Last Update: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-
 
-@app.callback(
+app.clientside_callback(
+    ClientsideFunction(namespace='qc', function_name='renderCreatinineAlert'),
     Output('creatinine-alert', 'children'),
-    Input('interval-component', 'n_intervals')
+    Input('qc-tick', 'data'),
 )
-def update_creatinine_alert(n):
-    alert = alert_flags['creatinine']
-    
-    if alert['status'] == 'ALERT':
-        style = {
-            'backgroundColor': '#e74c3c',
-            'color': 'white',
-            'padding': '15px',
-            'borderRadius': '5px',
-            'textAlign': 'center',
-            'fontWeight': 'bold'
-        }
-        return html.Div([
-            html.H4('🚨 CREATININE ALERT', style={'margin': '0 0 10px 0'}),
-            html.P(alert['message'], style={'margin': 0}),
-            html.P(f"Total Violations: {alert['count']}", style={'margin': '10px 0 0 0', 'fontSize': '14px'})
-        ], style=style)
-    else:
-        style = {
-            'backgroundColor': '#2ecc71',
-            'color': 'white',
-            'padding': '15px',
-            'borderRadius': '5px',
-            'textAlign': 'center',
-            'fontWeight': 'bold'
-        }
-        return html.Div([
-            html.H4('✅ CREATININE OK', style={'margin': '0 0 10px 0'}),
-            html.P('All controls within limits', style={'margin': 0})
-        ], style=style)
-
 
-@app.callback(
+app.clientside_callback(
+    ClientsideFunction(namespace='qc', function_name='renderUreaAlert'),
     Output('urea-alert', 'children'),
-    Input('interval-component', 'n_intervals')
+    Input('qc-tick', 'data'),
 )
-def update_urea_alert(n):
-    alert = alert_flags['urea']
-    
-    if alert['status'] == 'ALERT':
-        style = {
-            'backgroundColor': '#e74c3c',
-            'color': 'white',
-            'padding': '15px',
-            'borderRadius': '5px',
-            'textAlign': 'center',
-            'fontWeight': 'bold'
-        }
-        return html.Div([
-            html.H4('🚨 UREA ALERT', style={'margin': '0 0 10px 0'}),
-            html.P(alert['message'], style={'margin': 0}),
-            html.P(f"Total Violations: {alert['count']}", style={'margin': '10px 0 0 0', 'fontSize': '14px'})
-        ], style=style)
-    else:
-        style = {
-            'backgroundColor': '#2ecc71',
-            'color': 'white',
-            'padding': '15px',
-            'borderRadius': '5px',
-            'textAlign': 'center',
-            'fontWeight': 'bold'
-        }
-        return html.Div([
-            html.H4('✅ UREA OK', style={'margin': '0 0 10px 0'}),
-            html.P('All controls within limits', style={'margin': 0})
-        ], style=style)
 
-
-@app.callback(
-    Output('creatinine-chart', 'figure'),
-    Input('interval-component', 'n_intervals')
+app.clientside_callback(
+    ClientsideFunction(namespace='qc', function_name='renderCreatinineStats'),
+    Output('creatinine-stats', 'children'),
+    Input('qc-tick', 'data'),
 )
-def update_creatinine_chart(n):
-    storage = data_storage['creatinine']
-    params = qc.parameters['creatinine']
-    
-    times = list(storage['times'])
-    values = list(storage['values'])
-    
-    if len(times) == 0:
-        times = [datetime.now()]
-        values = [params['mean']]
-    
-    mean = params['mean']
-    std = params['std']
-    
-    fig = go.Figure()
-    
-    # Data points
-    fig.add_trace(go.Scatter(
-        x=times, y=values,
-        mode='lines+markers',
-        name='Measurements',
-        line=dict(color='#3498db', width=2),
-        marker=dict(size=8)
-    ))
-    
-    # Control limits
-    fig.add_hline(y=mean, line_dash="solid", line_color="green", line_width=2,
-                  annotation_text="Mean", annotation_position="right")
-    fig.add_hline(y=mean + std, line_dash="dash", line_color="yellow", line_width=1.5,
-                  annotation_text="+1 SD", annotation_position="right")
-    fig.add_hline(y=mean - std, line_dash="dash", line_color="yellow", line_width=1.5)
-    fig.add_hline(y=mean + 2*std, line_dash="dash", line_color="orange", line_width=1.5,
-                  annotation_text="+2 SD", annotation_position="right")
-    fig.add_hline(y=mean - 2*std, line_dash="dash", line_color="orange", line_width=1.5)
-    fig.add_hline(y=mean + 3*std, line_dash="solid", line_color="red", line_width=2,
-                  annotation_text="+3 SD", annotation_position="right")
-    fig.add_hline(y=mean - 3*std, line_dash="solid", line_color="red", line_width=2)
-    
-    fig.update_layout(
-        title='Creatinine - Real-Time Levey-Jennings Chart',
-        xaxis_title='Time',
-        yaxis_title=f'Creatinine ({params["unit"]})',
-        hovermode='x unified',
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(size=12)
-    )
-    
-    return fig
 
+app.clientside_callback(
+    ClientsideFunction(namespace='qc', function_name='renderUreaStats'),
+    Output('urea-stats', 'children'),
+    Input('qc-tick', 'data'),
+)
 
-@app.callback(
-    Output('urea-chart', 'figure'),
-    Input('interval-component', 'n_intervals')
+app.clientside_callback(
+    ClientsideFunction(namespace='qc', function_name='renderViolations'),
+    Output('violations-log', 'children'),
+    Input('qc-tick', 'data'),
 )
-def update_urea_chart(n):
-    storage = data_storage['urea']
-    params = qc.parameters['urea']
-    
-    times = list(storage['times'])
-    values = list(storage['values'])
-    
-    if len(times) == 0:
-        times = [datetime.now()]
-        values = [params['mean']]
-    
-    mean = params['mean']
-    std = params['std']
-    
-    fig = go.Figure()
-    
-    # Data points
-    fig.add_trace(go.Scatter(
-        x=times, y=values,
-        mode='lines+markers',
-        name='Measurements',
-        line=dict(color='#9b59b6', width=2),
-        marker=dict(size=8)
-    ))
-    
-    # Control limits
-    fig.add_hline(y=mean, line_dash="solid", line_color="green", line_width=2,
-                  annotation_text="Mean", annotation_position="right")
-    fig.add_hline(y=mean + std, line_dash="dash", line_color="yellow", line_width=1.5,
-                  annotation_text="+1 SD", annotation_position="right")
-    fig.add_hline(y=mean - std, line_dash="dash", line_color="yellow", line_width=1.5)
-    fig.add_hline(y=mean + 2*std, line_dash="dash", line_color="orange", line_width=1.5,
-                  annotation_text="+2 SD", annotation_position="right")
-    fig.add_hline(y=mean - 2*std, line_dash="dash", line_color="orange", line_width=1.5)
-    fig.add_hline(y=mean + 3*std, line_dash="solid", line_color="red", line_width=2,
-                  annotation_text="+3 SD", annotation_position="right")
-    fig.add_hline(y=mean - 3*std, line_dash="solid", line_color="red", line_width=2)
-    
-    fig.update_layout(
-        title='Urea - Real-Time Levey-Jennings Chart',
-        xaxis_title='Time',
-        yaxis_title=f'Urea ({params["unit"]})',
-        hovermode='x unified',
-        plot_bgcolor='white',
-        paper_bgcolor='white',
-        font=dict(size=12)
-    )
-    
-    return fig
 
 
-@app.callback(
-    Output('creatinine-stats', 'children'),
-    Input('interval-component', 'n_intervals')
+def _new_point_payload(last_total):
+    """Newest (time, value) pair for both analytes, or None
+
+    The charts grow clientside from this O(1) payload instead of the
+    server re-serializing two full figures every tick. ``last_total``
+    is the appended-points total the requesting client saw last — it
+    rides in that client's own qc-tick store, so one client receiving
+    a point never hides it from the others. Returns the payload (or
+    None while nothing is new to this client) and the current total.
+    """
+    window_c = data_storage['creatinine']['window']
+    window_u = data_storage['urea']['window']
+    with _locks['creatinine']:
+        # Compare totals, not len(): once the window fills, len() stays
+        # pegged at max_points while points keep arriving
+        total = window_c.total
+        if len(window_c) == 0 or total == last_total:
+            return None, total
+        t_new = window_c.times()[-1]
+        c_new = window_c.values()[-1]
+    with _locks['urea']:
+        u_new = window_u.values()[-1] if len(window_u) else None
+    if u_new is None:
+        return None, total
+
+    return {
+        't': np.datetime_as_string(t_new, unit='s').replace('T', ' '),
+        'c': c_new,
+        'u': u_new,
+        'max': max_points,
+    }, total
+
+
+app.clientside_callback(
+    ClientsideFunction(namespace='qc', function_name='extendCreatinine'),
+    Output('creatinine-chart', 'extendData'),
+    Input('qc-tick', 'data'),
 )
-def update_creatinine_stats(n):
-    stats = stats_storage['creatinine']
-    params = qc.parameters['creatinine']
-    
-    # Determine sigma color
-    sigma_val = stats.get('sigma', 0)
-    if sigma_val >= 6:
-        sigma_color = '#2ecc71'
-        sigma_text = 'World Class'
-    elif sigma_val >= 5:
-        sigma_color = '#27ae60'
-        sigma_text = 'Excellent'
-    elif sigma_val >= 4:
-        sigma_color = '#f39c12'
-        sigma_text = 'Good'
-    elif sigma_val >= 3:
-        sigma_color = '#e67e22'
-        sigma_text = 'Marginal'
-    else:
-        sigma_color = '#e74c3c'
-        sigma_text = 'Poor'
-    
-    return html.Div([
-        html.H4('Creatinine Statistics', style={'color': '#2c3e50', 'borderBottom': '2px solid #3498db', 'paddingBottom': '10px'}),
-        html.Table([
-            html.Tr([html.Td('Target Mean:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{params['mean']:.4f} {params['unit']}")]),
-            html.Tr([html.Td('Current Mean:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{stats.get('mean', 0):.4f} {params['unit']}")]),
-            html.Tr([html.Td('SD:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{stats.get('sd', 0):.4f}")]),
-            html.Tr([html.Td('CV:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{stats.get('cv', 0):.2f}%")]),
-            html.Tr([html.Td('Bias:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{stats.get('bias', 0):.2f}%")]),
-            html.Tr([html.Td('Sigma:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{sigma_val:.2f}", style={'color': sigma_color, 'fontWeight': 'bold'})]),
-            html.Tr([html.Td('Quality:', style={'fontWeight': 'bold'}), 
-                    html.Td(sigma_text, style={'color': sigma_color, 'fontWeight': 'bold'})]),
-            html.Tr([html.Td('N:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{stats.get('n', 0)}")]),
-        ], style={'width': '100%', 'fontSize': '14px'})
-    ], style={'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '5px'})
-
 
-@app.callback(
-    Output('urea-stats', 'children'),
-    Input('interval-component', 'n_intervals')
+app.clientside_callback(
+    ClientsideFunction(namespace='qc', function_name='extendUrea'),
+    Output('urea-chart', 'extendData'),
+    Input('qc-tick', 'data'),
 )
-def update_urea_stats(n):
-    stats = stats_storage['urea']
-    params = qc.parameters['urea']
-    
-    # Determine sigma color
-    sigma_val = stats.get('sigma', 0)
-    if sigma_val >= 6:
-        sigma_color = '#2ecc71'
-        sigma_text = 'World Class'
-    elif sigma_val >= 5:
-        sigma_color = '#27ae60'
-        sigma_text = 'Excellent'
-    elif sigma_val >= 4:
-        sigma_color = '#f39c12'
-        sigma_text = 'Good'
-    elif sigma_val >= 3:
-        sigma_color = '#e67e22'
-        sigma_text = 'Marginal'
-    else:
-        sigma_color = '#e74c3c'
-        sigma_text = 'Poor'
-    
-    return html.Div([
-        html.H4('Urea Statistics', style={'color': '#2c3e50', 'borderBottom': '2px solid #9b59b6', 'paddingBottom': '10px'}),
-        html.Table([
-            html.Tr([html.Td('Target Mean:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{params['mean']:.4f} {params['unit']}")]),
-            html.Tr([html.Td('Current Mean:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{stats.get('mean', 0):.4f} {params['unit']}")]),
-            html.Tr([html.Td('SD:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{stats.get('sd', 0):.4f}")]),
-            html.Tr([html.Td('CV:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{stats.get('cv', 0):.2f}%")]),
-            html.Tr([html.Td('Bias:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{stats.get('bias', 0):.2f}%")]),
-            html.Tr([html.Td('Sigma:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{sigma_val:.2f}", style={'color': sigma_color, 'fontWeight': 'bold'})]),
-            html.Tr([html.Td('Quality:', style={'fontWeight': 'bold'}), 
-                    html.Td(sigma_text, style={'color': sigma_color, 'fontWeight': 'bold'})]),
-            html.Tr([html.Td('N:', style={'fontWeight': 'bold'}), 
-                    html.Td(f"{stats.get('n', 0)}")]),
-        ], style={'width': '100%', 'fontSize': '14px'})
-    ], style={'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '5px'})
+
+
+def _violations_payload(last_counts):
+    """Ten most recent violations as plain dicts, or None while stable
+
+    Plain JSON so the log renders clientside like every other panel;
+    None means the counts have not moved and the client keeps its DOM.
+    ``last_counts`` is the count pair the requesting client rendered
+    last, carried in its own qc-tick store — most ticks add no
+    violation, so each client rebuilds its log only when a count moves
+    past what that client has seen. Returns the payload (or None) and
+    the current counts.
+    """
+    counts = [alert_flags['creatinine']['count'], alert_flags['urea']['count']]
+    if counts == last_counts:
+        return None, counts
+
+    with _locks['creatinine']:
+        viols_c = list(data_storage['creatinine']['violations'])
+    with _locks['urea']:
+        viols_u = list(data_storage['urea']['violations'])
+
+    # Each deque is already time-ordered; a bounded merge picks the 10
+    # most recent without materializing and sorting the full set
+    recent = nlargest(
+        10,
+        chain((('creatinine', v) for v in viols_c),
+              (('urea', v) for v in viols_u)),
+        key=lambda av: av[1]['time'])
+
+    return [{
+        'analyte': analyte,
+        'rule': v['rule'],
+        'severity': v['severity'],
+        'message': v['message'],
+        'value': v['value'],
+        'time': v['time'].strftime('%H:%M:%S'),
+    } for analyte, v in recent], counts
 
 
 @app.callback(
-    Output('violations-log', 'children'),
-    Input('interval-component', 'n_intervals')
+    Output('qc-tick', 'data'),
+    Input('interval-component', 'n_intervals'),
+    State('qc-tick', 'data')
 )
-def update_violations_log(n):
-    all_violations = []
-    
-    for analyte in ['creatinine', 'urea']:
-        violations = list(data_storage[analyte]['violations'])
-        for v in violations:
-            all_violations.append({
-                'analyte': analyte,
-                'time': v['time'],
-                'rule': v['rule'],
-                'severity': v['severity'],
-                'message': v['message'],
-                'value': v['value']
-            })
-    
-    # Sort by time (most recent first)
-    all_violations.sort(key=lambda x: x['time'], reverse=True)
-    
-    if len(all_violations) == 0:
-        return html.Div('No violations detected', 
-                       style={'textAlign': 'center', 'color': '#7f8c8d', 'padding': '20px'})
-    
-    violation_items = []
-    for v in all_violations[:10]:  # Show last 10
-        severity_color = '#e74c3c' if v['severity'] == 'CRITICAL' else '#f39c12'
-        
-        violation_items.append(
-            html.Div([
-                html.Div([
-                    html.Span(v['analyte'].upper(), 
-                             style={'fontWeight': 'bold', 'marginRight': '10px'}),
-                    html.Span(v['rule'], 
-                             style={'backgroundColor': severity_color, 'color': 'white',
-                                   'padding': '2px 8px', 'borderRadius': '3px', 'fontSize': '12px',
-                                   'marginRight': '10px'}),
-                    html.Span(v['time'].strftime('%H:%M:%S'), 
-                             style={'color': '#7f8c8d', 'fontSize': '12px'})
-                ]),
-                html.Div(v['message'], style={'marginTop': '5px', 'fontSize': '14px'}),
-                html.Div(f"Value: {v['value']:.4f}", 
-                        style={'marginTop': '5px', 'fontSize': '12px', 'color': '#7f8c8d'})
-            ], style={'backgroundColor': 'white', 'padding': '15px', 'borderRadius': '5px',
-                     'marginBottom': '10px', 'borderLeft': f'4px solid {severity_color}'})
-        )
-    
-    return html.Div(violation_items)
+def update_dashboard(n, tick):
+    """Publish the per-tick snapshot every live element renders from
+
+    One HTTP round-trip and one small JSON object per tick; sections
+    with nothing new carry None and the clientside renderers keep
+    their current DOM. The data version rides in each client's own
+    qc-tick store, so every connected browser skips only the ticks it
+    has already seen instead of the first poller consuming the tick
+    for all of them.
+    """
+    version = _data_version[0]
+    if tick is not None and tick.get('version') == version:
+        raise PreventUpdate
+
+    point, total = _new_point_payload(tick.get('total', -1) if tick else -1)
+    viol, counts = _violations_payload(tick.get('counts') if tick else None)
+    return {
+        'version': version,
+        'total': total,
+        'counts': counts,
+        'point': point,
+        'state': _state_payload(),
+        'viol': viol,
+    }
 
 
 @app.callback(
@@ -635,31 +675,39 @@ def update_violations_log(n):
     prevent_initial_call=True
 )
 def export_data(n_clicks):
-    # Combine all data
-    export_data = []
-    
-    for analyte in ['creatinine', 'urea']:
-        times = list(data_storage[analyte]['times'])
-        values = list(data_storage[analyte]['values'])
-        
-        for t, v in zip(times, values):
-            export_data.append({
-                'Analyte': analyte,
-                'Time': t.strftime('%Y-%m-%d %H:%M:%S'),
-                'Value': v,
-                'Mean': stats_storage[analyte].get('mean', 0),
-                'SD': stats_storage[analyte].get('sd', 0),
-                'CV': stats_storage[analyte].get('cv', 0),
-                'Bias': stats_storage[analyte].get('bias', 0),
-                'Sigma': stats_storage[analyte].get('sigma', 0)
-            })
-    
-    df = pd.DataFrame(export_data)
-    return dcc.send_data_frame(df.to_csv, f"qc_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv", index=False)
+    """Stream the current windows out as CSV
+
+    csv.writer over a StringIO: for a couple of hundred rows the
+    DataFrame detour cost more than the whole export, most of it on
+    the first pandas touch.
+    """
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(['Analyte', 'Time', 'Value',
+                     'Mean', 'SD', 'CV', 'Bias', 'Sigma'])
+
+    for analyte in _ANALYTES:
+        with _locks[analyte]:
+            times, values = data_storage[analyte]['window'].snapshot()
+            stats = dict(stats_storage[analyte])
+        times_iso = np.char.replace(
+            np.datetime_as_string(times, unit='s'), 'T', ' ')
+        writer.writerows(zip(repeat(analyte), times_iso, values,
+                             repeat(stats.get('mean', 0)),
+                             repeat(stats.get('sd', 0)),
+                             repeat(stats.get('cv', 0)),
+                             repeat(stats.get('bias', 0)),
+                             repeat(stats.get('sigma', 0))))
+
+    return dict(
+        content=buf.getvalue(),
+        filename=f"qc_data_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv")
 
 
 @app.callback(
     Output('interval-component', 'n_intervals'),
+    Output('creatinine-chart', 'figure'),
+    Output('urea-chart', 'figure'),
     Input('reset-button', 'n_clicks'),
     State('interval-component', 'n_intervals'),
     prevent_initial_call=True
@@ -667,13 +715,15 @@ def export_data(n_clicks):
 def reset_data(n_clicks, current_interval):
     # Clear all data
     for analyte in ['creatinine', 'urea']:
-        data_storage[analyte]['times'].clear()
-        data_storage[analyte]['values'].clear()
-        data_storage[analyte]['violations'].clear()
-        stats_storage[analyte] = {'mean': 0, 'sd': 0, 'cv': 0, 'bias': 0, 'sigma': 0}
-        alert_flags[analyte] = {'status': 'OK', 'message': '', 'count': 0}
-    
-    return 0
+        with _locks[analyte]:
+            data_storage[analyte]['window'].clear()
+            data_storage[analyte]['violations'].clear()
+            stats_storage[analyte] = {'mean': 0, 'sd': 0, 'cv': 0, 'bias': 0, 'sigma': 0}
+            alert_flags[analyte] = {'status': 'OK', 'message': '', 'count': 0}
+    _data_version[0] += 1
+
+    # Fresh figures so the clients drop the extended traces too
+    return 0, build_static_figure('creatinine'), build_static_figure('urea')
 
 
 if __name__ == '__main__':
@@ -692,7 +742,7 @@ if __name__ == '__main__':
     print("   • Real-time statistics (Mean, SD, CV, Bias, Sigma)")
     print("   • Alert notifications for violations")
     print("   • Data export to CSV")
-    print("   • Auto-refresh every 1 second")
+    print("   • Auto-refresh every 2 seconds")
     print("\n⚠️  Press Ctrl+C to stop the server")
     print("="*80 + "\n")
     
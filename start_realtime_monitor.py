@@ -5,7 +5,7 @@ Automatically detects and runs the best monitoring option
 """
 
 import sys
-import subprocess
+import threading
 
 def check_package(package_name):
     """Check if a Python package is installed"""
@@ -15,6 +15,30 @@ def check_package(package_name):
     except ImportError:
         return False
 
+def run_web():
+    """Run the Dash dashboard in this process
+
+    Importing instead of spawning a second interpreter skips a full
+    Python boot and a duplicate NumPy/Pandas/Dash load. The monitor
+    module only builds the app at import; the generator thread and
+    server start here.
+    """
+    import realtime_qc_monitor as monitor
+    threading.Thread(target=monitor.data_generator, daemon=True).start()
+    try:
+        from waitress import serve
+    except ImportError:
+        # Flask's dev server serializes concurrent viewers; fine for a
+        # single user, see wsgi.py for the production entry point
+        monitor.app.run(debug=False, host='0.0.0.0', port=8050)
+    else:
+        serve(monitor.app.server, host='0.0.0.0', port=8050, threads=8)
+
+def run_desktop():
+    """Run the matplotlib desktop monitor in this process"""
+    import realtime_qc_desktop
+    realtime_qc_desktop.main()
+
 def main():
     print("\n" + "="*80)
     print("🔬 REAL-TIME QC MONITORING - QUICK START")
@@ -39,13 +63,13 @@ def main():
     # Decide what to offer
     options = []
     if has_dash:
-        options.append(('web', 'Web Dashboard (Recommended)', 'realtime_qc_monitor.py'))
+        options.append(('web', 'Web Dashboard (Recommended)', run_web))
     if has_matplotlib:
-        options.append(('desktop', 'Desktop Application', 'realtime_qc_desktop.py'))
+        options.append(('desktop', 'Desktop Application', run_desktop))
     
     if len(options) == 1:
         # Only one option available, use it
-        opt_type, opt_name, opt_file = options[0]
+        opt_type, opt_name, launch = options[0]
         print(f"\n🚀 Starting {opt_name}...")
         
         if opt_type == 'web':
@@ -55,18 +79,17 @@ def main():
             print("\n⏳ Please wait while the server starts...")
             print("🌐 Your browser will show: http://127.0.0.1:8050")
             print("⚠️  Press Ctrl+C to stop the server\n")
-            subprocess.run([sys.executable, opt_file])
         else:
             print("\n" + "="*80)
             print("🖥️  DESKTOP APPLICATION STARTING")
             print("="*80)
             print("\n⚠️  Close the window to stop monitoring\n")
-            subprocess.run([sys.executable, opt_file])
+        launch()
     
     else:
         # Multiple options, let user choose
         print("\n📋 Select monitoring method:")
-        for i, (opt_type, opt_name, opt_file) in enumerate(options, 1):
+        for i, (opt_type, opt_name, launch) in enumerate(options, 1):
             print(f"   {i}. {opt_name}")
         
         while True:
@@ -80,7 +103,7 @@ def main():
                 print("\n\nExiting.")
                 sys.exit(0)
         
-        opt_type, opt_name, opt_file = options[idx]
+        opt_type, opt_name, launch = options[idx]
         print(f"\n🚀 Starting {opt_name}...")
         
         if opt_type == 'web':
@@ -97,13 +120,12 @@ def main():
             print("   • Data export to CSV")
             print("\n⚠️  Press Ctrl+C to stop the server\n")
             print("="*80 + "\n")
-            subprocess.run([sys.executable, opt_file])
         else:
             print("\n" + "="*80)
             print("🖥️  DESKTOP APPLICATION STARTING")
             print("="*80)
             print("\n⚠️  Close the window to stop monitoring\n")
-            subprocess.run([sys.executable, opt_file])
+        launch()
 
 if __name__ == '__main__':
     try:
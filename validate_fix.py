@@ -4,118 +4,140 @@ Comprehensive validation test for the fixed DualRealtimeQCMonitor
 This test validates that the PicklingError is fixed without needing GUI
 """
 
+import importlib
+import pickle
 import sys
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
-def test_imports():
+import matplotlib
+matplotlib.use('Agg')  # Non-GUI backend, set once before any pyplot import
+
+from lab_qc_analysis import LabQCAnalysis
+from realtime_qc_desktop import DualRealtimeQCMonitor, RealtimeQCMonitor
+
+# pyplot's figure registry is global: plt.subplot attaches axes to the
+# current figure, so monitor construction must not interleave across
+# threads
+_pyplot_lock = threading.Lock()
+
+def test_imports(ctx):
     """Test that all required modules can be imported"""
-    print("🧪 Test 1: Importing modules...")
+    # Each test buffers its lines and flushes them in one write, so
+    # concurrent tests never interleave output
+    log = ["🧪 Test 1: Importing modules..."]
+    modules = ['numpy', 'matplotlib.pyplot', 'matplotlib.animation',
+               'matplotlib.patches', 'collections']
     try:
-        import numpy as np
-        import matplotlib
-        matplotlib.use('Agg')  # Use non-GUI backend for testing
-        import matplotlib.pyplot as plt
-        import matplotlib.animation as animation
-        from matplotlib.patches import Rectangle
-        from collections import deque
-        print("   ✅ All core modules imported successfully")
+        for name in modules:
+            importlib.import_module(name)
+        log.append("   ✅ All core modules imported successfully")
         return True
     except ImportError as e:
-        print(f"   ❌ Import failed: {e}")
+        log.append(f"   ❌ Import failed: {e}")
         return False
+    finally:
+        sys.stdout.write('\n'.join(log) + '\n')
 
-def test_lab_qc_analysis():
+def test_lab_qc_analysis(ctx):
     """Test that LabQCAnalysis class can be instantiated"""
-    print("\n🧪 Test 2: LabQCAnalysis instantiation...")
+    log = ["\n🧪 Test 2: LabQCAnalysis instantiation..."]
     try:
-        from lab_qc_analysis import LabQCAnalysis
         qc = LabQCAnalysis(seed=42)
-        print(f"   ✅ LabQCAnalysis created")
-        print(f"      - Analytes: {list(qc.parameters.keys())}")
+        log.append(f"   ✅ LabQCAnalysis created")
+        log.append(f"      - Analytes: {list(qc.parameters.keys())}")
         return True
     except Exception as e:
-        print(f"   ❌ Failed: {e}")
-        traceback.print_exc()
+        log.append(f"   ❌ Failed: {e}")
+        log.append(traceback.format_exc())
         return False
+    finally:
+        sys.stdout.write('\n'.join(log) + '\n')
 
-def test_single_monitor():
+def test_single_monitor(ctx):
     """Test that RealtimeQCMonitor can be instantiated"""
-    print("\n🧪 Test 3: RealtimeQCMonitor (single analyte)...")
+    log = ["\n🧪 Test 3: RealtimeQCMonitor (single analyte)..."]
     try:
-        import matplotlib
-        matplotlib.use('Agg')
-        from realtime_qc_desktop import RealtimeQCMonitor
-        
-        monitor = RealtimeQCMonitor('creatinine', max_points=50)
-        print(f"   ✅ Single monitor created")
-        print(f"      - Analyte: {monitor.analyte}")
-        print(f"      - Max points: {monitor.max_points}")
-        
+        with _pyplot_lock:
+            monitor = RealtimeQCMonitor('creatinine', max_points=50)
+        log.append(f"   ✅ Single monitor created")
+        log.append(f"      - Analyte: {monitor.analyte}")
+        log.append(f"      - Max points: {monitor.max_points}")
+
         # Test data generation
         val = monitor.generate_measurement()
-        print(f"      - Generated value: {val:.4f}")
+        log.append(f"      - Generated value: {val:.4f}")
         return True
     except Exception as e:
-        print(f"   ❌ Failed: {e}")
-        traceback.print_exc()
+        log.append(f"   ❌ Failed: {e}")
+        log.append(traceback.format_exc())
         return False
+    finally:
+        sys.stdout.write('\n'.join(log) + '\n')
 
-def test_dual_monitor():
+def test_dual_monitor(ctx):
     """Test that DualRealtimeQCMonitor can be instantiated (THE FIX!)"""
-    print("\n🧪 Test 4: DualRealtimeQCMonitor (THE FIX)...")
+    log = ["\n🧪 Test 4: DualRealtimeQCMonitor (THE FIX)..."]
     try:
-        import matplotlib
-        matplotlib.use('Agg')
-        from realtime_qc_desktop import DualRealtimeQCMonitor
-        
-        dual_monitor = DualRealtimeQCMonitor(max_points=50)
-        print(f"   ✅ DualRealtimeQCMonitor created successfully!")
-        print(f"      - Monitors: {list(dual_monitor.monitors.keys())}")
-        print(f"      - Max points: {dual_monitor.max_points}")
-        
+        with _pyplot_lock:
+            dual_monitor = DualRealtimeQCMonitor(max_points=50)
+        ctx['dual_cls'] = DualRealtimeQCMonitor
+        ctx['dual_instance'] = dual_monitor
+        log.append(f"   ✅ DualRealtimeQCMonitor created successfully!")
+        log.append(f"      - Monitors: {list(dual_monitor.monitors.keys())}")
+        log.append(f"      - Max points: {dual_monitor.max_points}")
+
         # Test data generation for both analytes
         creat_val = dual_monitor.generate_measurement('creatinine')
         urea_val = dual_monitor.generate_measurement('urea')
-        print(f"      - Creatinine value: {creat_val:.4f} mg/dL")
-        print(f"      - Urea value: {urea_val:.4f} mg/dL")
-        
-        # Test statistics update
-        dual_monitor.monitors['creatinine']['values'].append(creat_val)
-        dual_monitor.monitors['creatinine']['values'].append(creat_val + 0.1)
-        dual_monitor.monitors['creatinine']['values'].append(creat_val - 0.1)
-        dual_monitor.update_statistics('creatinine')
+        log.append(f"      - Creatinine value: {creat_val:.4f} mg/dL")
+        log.append(f"      - Urea value: {urea_val:.4f} mg/dL")
+
+        # Test incremental statistics: push enough points to force
+        # evictions, then compare against a one-shot computation
+        import numpy as np
+        for i in range(60):
+            dual_monitor.push_value('creatinine', creat_val + 0.1 * (i % 7 - 3))
         stats = dual_monitor.monitors['creatinine']['stats']
-        print(f"      - Stats calculated: Mean={stats['mean']:.4f}, SD={stats['sd']:.4f}")
-        
+        window = np.array(dual_monitor.monitors['creatinine']['values'])
+        assert abs(stats['mean'] - np.mean(window)) < 1e-12
+        assert abs(stats['sd'] - np.std(window, ddof=1)) < 1e-12
+        log.append(f"      - Stats calculated: Mean={stats['mean']:.4f}, SD={stats['sd']:.4f}")
+        log.append(f"      - Incremental stats match one-shot mean/std")
+
         return True
     except Exception as e:
-        print(f"   ❌ Failed: {e}")
-        traceback.print_exc()
+        log.append(f"   ❌ Failed: {e}")
+        log.append(traceback.format_exc())
         return False
+    finally:
+        sys.stdout.write('\n'.join(log) + '\n')
 
-def test_no_pickling_error():
-    """Verify that the class can be referenced without pickling issues"""
-    print("\n🧪 Test 5: No PicklingError check...")
+def test_no_pickling_error(ctx):
+    """Verify that the class can be pickled without rebuilding a monitor"""
+    log = ["\n🧪 Test 5: No PicklingError check..."]
     try:
-        import matplotlib
-        matplotlib.use('Agg')
-        from realtime_qc_desktop import DualRealtimeQCMonitor
-        
-        # This would have failed before with PicklingError
-        monitor_class = DualRealtimeQCMonitor
-        print(f"   ✅ Class can be referenced: {monitor_class.__name__}")
-        print(f"   ✅ No PicklingError - fix is working!")
+        # Reuse the class test 4 already exercised — no second Figure.
+        # Under the thread pool test 4 may still be running, so fall
+        # back to the module-scope import (the same class object).
+        cls = ctx.get('dual_cls', DualRealtimeQCMonitor)
+        pickle.dumps(cls)  # This would have failed before with PicklingError
+        log.append(f"   ✅ Class pickles cleanly: {cls.__name__}")
+        log.append(f"   ✅ No PicklingError - fix is working!")
         return True
     except Exception as e:
-        print(f"   ❌ Failed: {e}")
-        traceback.print_exc()
+        log.append(f"   ❌ Failed: {e}")
+        log.append(traceback.format_exc())
         return False
+    finally:
+        sys.stdout.write('\n'.join(log) + '\n')
 
 def main():
     print("="*80)
     print("🔬 DUAL MONITOR FIX - VALIDATION TEST SUITE")
     print("="*80)
-    
+
     tests = [
         test_imports,
         test_lab_qc_analysis,
@@ -123,19 +145,23 @@ def main():
         test_dual_monitor,
         test_no_pickling_error
     ]
-    
-    results = []
-    for test in tests:
-        result = test()
-        results.append(result)
-    
+
+    # The import check runs first and synchronously so backend
+    # selection is committed before any worker touches pyplot; the
+    # rest of the suite runs concurrently
+    ctx = {}
+    results = [tests[0](ctx)]
+    remaining = tests[1:]
+    with ThreadPoolExecutor(max_workers=len(tests)) as pool:
+        results.extend(pool.map(lambda test: test(ctx), remaining))
+
     print("\n" + "="*80)
     print("📊 TEST RESULTS")
     print("="*80)
     passed = sum(results)
     total = len(results)
     print(f"Passed: {passed}/{total}")
-    
+
     if passed == total:
         print("\n🎉 ALL TESTS PASSED! The PicklingError is FIXED!")
         print("\n✅ The DualRealtimeQCMonitor is working correctly!")
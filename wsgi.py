@@ -0,0 +1,15 @@
+"""WSGI entry point for the QC dashboard
+
+The dashboard keeps its state in-process, shared with the generator
+thread, so run exactly one worker and scale with threads:
+
+    gunicorn --workers 1 --threads 8 wsgi:application
+"""
+
+import threading
+
+import realtime_qc_monitor as monitor
+
+threading.Thread(target=monitor.data_generator, daemon=True).start()
+
+application = monitor.app.server